@@ -8,6 +8,8 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path so we can import from forecast
 project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root))
@@ -20,22 +22,41 @@ def main():
     config = load_config()
     hourly = load_data(config)
 
-    # Group by day
+    # Quantize whole columns in one vectorized pass instead of per-value
+    # round() calls inside the day loop
+    net_load = np.round(hourly["net_load_w"].to_numpy(), 1)
+    price = np.round(hourly["price_pln_kwh"].to_numpy(), 4)
+
+    # Day slices straight off the int64 index: groupby(index.date) boxes
+    # every timestamp into a Python date and materializes frame slices
     days = []
-    for date, group in hourly.groupby(hourly.index.date):
-        if len(group) < 20:
-            continue
-        days.append({
-            "date": str(date),
-            "net_load_w": [round(v, 1) for v in group["net_load_w"].tolist()],
-            "price_pln_kwh": [round(v, 4) for v in group["price_pln_kwh"].tolist()],
-        })
+    if len(hourly) > 0:
+        # as_unit pins the epoch-integer resolution regardless of input unit
+        day_ids = hourly.index.as_unit("ns").asi8 // (86400 * 10**9)
+        boundaries = np.where(np.diff(day_ids))[0] + 1
+        labels = np.datetime_as_string(
+            day_ids[np.r_[0, boundaries]].astype("datetime64[D]"), unit="D"
+        )
+        for label, nl, pr in zip(
+            labels, np.split(net_load, boundaries), np.split(price, boundaries)
+        ):
+            if len(nl) < 20:
+                continue
+            days.append({
+                "date": str(label),
+                "net_load_w": nl.tolist(),
+                "price_pln_kwh": pr.tolist(),
+            })
 
     out_path = Path(__file__).parent.parent / "data" / "hourly.json"
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(out_path, "w") as f:
-        json.dump(days, f, separators=(",", ":"))
+    try:
+        import orjson
+        payload = orjson.dumps(days)
+    except ImportError:
+        payload = json.dumps(days, separators=(",", ":")).encode()
+    out_path.write_bytes(payload)
 
     size_kb = out_path.stat().st_size / 1024
     print(f"Exported {len(days)} days to {out_path} ({size_kb:.0f} KB)")
@@ -6,11 +6,12 @@ Usage:
 """
 
 import argparse
+import json
 
 import numpy as np
 import pandas as pd
 
-from .config import load_config, project_root
+from .config import load_config, project_root, python_root
 from .data_loading import load_sensor_data, load_spot_prices
 from .optimize import (
     BatteryParams,
@@ -21,11 +22,38 @@ from .optimize import (
 )
 
 
+def _load_data_sources(root) -> dict[str, int]:
+    """Map every CSV feeding load_data to its st_mtime_ns."""
+    files = [root / "input" / "grid_power.csv"]
+    files += sorted((root / "input" / "recent").glob("*.csv"))
+    return {str(p): p.stat().st_mtime_ns for p in files if p.exists()}
+
+
 def load_data(config: dict) -> pd.DataFrame:
-    """Load grid power and spot prices, return aligned hourly DataFrame."""
+    """Load grid power and spot prices, return aligned hourly DataFrame.
+
+    The aligned frame is cached to Parquet keyed by source CSV mtimes,
+    so the ROI/backtest CLIs skip the CSV parse on reruns.
+    """
     root = project_root()
     sensors = config["sensors"]
 
+    cache_dir = python_root() / "cache"
+    cache_path = cache_dir / "hourly_backtest.parquet"
+    manifest_path = cache_dir / "hourly_backtest.json"
+    sources = _load_data_sources(root)
+
+    if cache_path.exists() and manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            manifest = None
+        if manifest == sources:
+            hourly = pd.read_parquet(cache_path)
+            print(f"  {len(hourly)} aligned hours (cached)")
+            return hourly
+
     print("Loading grid power...")
     grid_df = load_sensor_data(
         sensor_id=sensors["grid_power"],
@@ -42,6 +70,11 @@ def load_data(config: dict) -> pd.DataFrame:
     hourly = prepare_hourly_data(grid_df, spot_df)
     print(f"  {len(hourly)} aligned hours ({hourly.index.min()} to {hourly.index.max()})")
 
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    hourly.to_parquet(cache_path)
+    with open(manifest_path, "w") as f:
+        json.dump(sources, f)
+
     return hourly
 
 
@@ -11,7 +11,10 @@ Usage:
 """
 
 import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -19,6 +22,8 @@ import pandas as pd
 from .config import load_config, project_root, python_root
 from .data_loading import load_sensor_data, load_spot_prices
 from .features import (
+    _lagged,
+    _rolling_mean,
     build_pv_features,
     build_consumption_features,
     build_heating_features,
@@ -29,23 +34,98 @@ from .models.lightgbm_model import LightGBMModel
 from .optimize import BatteryParams, optimize_battery, simulate_no_battery
 from .weather import fetch_historical
 
+ONE_DAY = pd.Timedelta(days=1)
+
+
+# Loaded once per process; booster parsing is the slow part of startup
+_models_cache: dict[str, LightGBMModel] | None = None
+
 
 def load_models() -> dict[str, LightGBMModel]:
-    """Load all 5 trained LightGBM models."""
-    model_dir = python_root() / "models"
-    models = {}
-    for name in ("pv", "consumption", "heat_pump", "spot_price", "dhw"):
-        models[name] = LightGBMModel.load(str(model_dir / f"{name}_model"))
-    return models
+    """Load all 5 trained LightGBM models (cached per process)."""
+    global _models_cache
+    if _models_cache is None:
+        model_dir = python_root() / "models"
+        _models_cache = {
+            name: LightGBMModel.load(str(model_dir / f"{name}_model"))
+            for name in ("pv", "consumption", "heat_pump", "spot_price", "dhw")
+        }
+    return _models_cache
+
+
+# Cache of (model features, frame columns) -> column positions, computed once
+_feature_positions: dict[tuple, list[int]] = {}
 
 
 def predict_model(model: LightGBMModel, features: pd.DataFrame) -> np.ndarray:
-    """Predict using only the features the model was trained with."""
-    return model.predict(features[model.feature_names])
+    """Predict via the native booster using only the trained feature columns.
+
+    Avoids the per-call DataFrame column-subset copy; num_threads=1 skips
+    OpenMP dispatch overhead that dwarfs the work at 24-row batch sizes.
+    """
+    key = (tuple(model.feature_names), tuple(features.columns))
+    positions = _feature_positions.get(key)
+    if positions is None:
+        positions = [features.columns.get_loc(n) for n in model.feature_names]
+        _feature_positions[key] = positions
+
+    # float32 halves the bytes crossing the Python/C boundary; the features
+    # are physical measurements, well within float32 precision
+    X = features.to_numpy(dtype=np.float32)[:, positions]
+    return model.booster.predict(X, num_threads=1)
+
+
+def _hourly_cache_sources(root: Path, sensor_defs: dict) -> dict[str, int]:
+    """Map every CSV feeding load_all_sensor_data to its st_mtime_ns."""
+    files = [root / "input" / legacy for _, legacy in sensor_defs.values()]
+    files += sorted((root / "input" / "recent").glob("*.csv"))
+    return {str(p): p.stat().st_mtime_ns for p in files if p.exists()}
+
+
+def _read_hourly_cache(
+    cache_path: Path, manifest_path: Path, sources: dict[str, int]
+) -> dict[str, pd.Series] | None:
+    """Return cached hourly series if the source CSVs are unchanged."""
+    if not (cache_path.exists() and manifest_path.exists()):
+        return None
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest != sources:
+        return None
+
+    wide = pd.read_parquet(cache_path)
+    hourly = {}
+    for name in wide.columns:
+        s = wide[name]
+        first, last = s.first_valid_index(), s.last_valid_index()
+        if first is None:
+            continue
+        # Trim the outer-join padding back to each sensor's own span
+        hourly[name] = s.loc[first:last]
+    return hourly
+
+
+def _write_hourly_cache(
+    cache_path: Path,
+    manifest_path: Path,
+    sources: dict[str, int],
+    hourly: dict[str, pd.Series],
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(hourly).to_parquet(cache_path)
+    with open(manifest_path, "w") as f:
+        json.dump(sources, f)
 
 
 def load_all_sensor_data(config: dict) -> dict[str, pd.Series]:
-    """Load and resample all sensor data to hourly UTC series."""
+    """Load and resample all sensor data to hourly UTC series.
+
+    Results are cached to Parquet keyed by source CSV mtimes, so reruns
+    skip the CSV parse + resample stage entirely.
+    """
     root = project_root()
     sensors = config["sensors"]
 
@@ -56,7 +136,18 @@ def load_all_sensor_data(config: dict) -> dict[str, pd.Series]:
         "dhw": (sensors["hp_dhw"], "pump_cwu_power_consumed.csv"),
     }
 
-    hourly = {}
+    cache_dir = python_root() / "cache"
+    cache_path = cache_dir / "hourly_sensors.parquet"
+    manifest_path = cache_dir / "hourly_sensors.json"
+    sources = _hourly_cache_sources(root, sensor_defs)
+
+    cached = _read_hourly_cache(cache_path, manifest_path, sources)
+    if cached is not None:
+        for name, series in cached.items():
+            print(f"  {name}: {len(series)} hourly samples (cached)")
+        return cached
+
+    raw = {}
     for name, (sensor_id, legacy_file) in sensor_defs.items():
         df = load_sensor_data(
             sensor_id=sensor_id,
@@ -66,61 +157,105 @@ def load_all_sensor_data(config: dict) -> dict[str, pd.Series]:
         if df.empty:
             print(f"  Warning: no data for {name} ({sensor_id})")
             continue
-        df = df.set_index("timestamp")
-        df.index = df.index.tz_convert("UTC")
-        hourly[name] = df["value"].resample("h").mean()
-        print(f"  {name}: {len(hourly[name])} hourly samples")
+        s = df.set_index("timestamp")["value"]
+        raw[name] = s.tz_convert("UTC")
 
     # Load spot prices
     spot_df = load_spot_prices(root / "input" / "recent" / "historic_spot_prices.csv")
-    spot_df = spot_df.set_index("timestamp")
-    if spot_df.index.tz is None:
-        spot_df.index = spot_df.index.tz_localize("UTC")
-    else:
-        spot_df.index = spot_df.index.tz_convert("UTC")
-    hourly["price"] = spot_df["value"].resample("h").mean()
-    print(f"  price: {len(hourly['price'])} hourly samples")
+    s = spot_df.set_index("timestamp")["value"]
+    raw["price"] = s.tz_localize("UTC") if s.index.tz is None else s.tz_convert("UTC")
+
+    # One resample over the wide frame: hour bins are computed once for
+    # all sensors instead of once per series
+    hourly_wide = pd.concat(raw, axis=1, sort=True).resample("h").mean()
+
+    hourly = {}
+    for name in hourly_wide.columns:
+        s = hourly_wide[name]
+        first, last = s.first_valid_index(), s.last_valid_index()
+        if first is None:
+            continue
+        hourly[name] = s.loc[first:last]
+        print(f"  {name}: {len(hourly[name])} hourly samples")
+
+    _write_hourly_cache(cache_path, manifest_path, sources, hourly)
 
     return hourly
 
 
+def align_hourly(hourly: dict[str, pd.Series]) -> dict:
+    """Outer-join all hourly series onto one full hourly UTC index.
+
+    Returns a dict with the shared DatetimeIndex and one float ndarray per
+    sensor. Day extraction then becomes integer slicing instead of repeated
+    label-based lookups.
+    """
+    wide = pd.DataFrame(hourly)
+    full_idx = pd.date_range(
+        wide.index.min(), wide.index.max(), freq="h", tz="UTC"
+    )
+    wide = wide.reindex(full_idx)
+
+    aligned = {"index": full_idx}
+    for name in wide.columns:
+        aligned[name] = wide[name].to_numpy()
+    return aligned
+
+
 def get_day_actuals(
-    hourly: dict[str, pd.Series], day: pd.Timestamp
+    aligned: dict, day: pd.Timestamp
 ) -> dict[str, np.ndarray] | None:
     """Extract aligned hourly actual data for one day. Returns None if insufficient."""
-    day_end = day + pd.Timedelta(days=1)
-
     # Grid and price are required
     for key in ("grid", "price"):
-        if key not in hourly:
+        if key not in aligned:
             return None
 
-    grid = hourly["grid"].loc[day:day_end - pd.Timedelta(hours=1)].dropna()
-    price = hourly["price"].loc[day:day_end - pd.Timedelta(hours=1)].dropna()
+    day_end = day + ONE_DAY
+    idx = aligned["index"]
+    i0 = idx.searchsorted(day)
+    i1 = idx.searchsorted(day_end)
+    if i1 <= i0:
+        return None
 
-    # Intersect on common hours
-    common_idx = grid.index.intersection(price.index)
-    if len(common_idx) < 20:
+    grid = aligned["grid"][i0:i1]
+    price = aligned["price"][i0:i1]
+
+    # Keep only hours where both grid and price are present
+    valid = ~np.isnan(grid) & ~np.isnan(price)
+    n_valid = int(valid.sum())
+    if n_valid < 20:
         return None
 
-    grid = grid.reindex(common_idx)
-    price = price.reindex(common_idx)
-    pv = hourly.get("pv", pd.Series(dtype=float)).reindex(common_idx).fillna(0).clip(lower=0)
-    hp = hourly.get("hp", pd.Series(dtype=float)).reindex(common_idx).fillna(0).clip(lower=0)
-    dhw = hourly.get("dhw", pd.Series(dtype=float)).reindex(common_idx).fillna(0).clip(lower=0)
+    # Typical days are fully clean — skip the fancy-indexing copies then
+    if n_valid < len(valid):
+        grid = grid[valid]
+        price = price[valid]
+        index = aligned["index"][i0:i1][valid]
+    else:
+        index = aligned["index"][i0:i1]
+        valid = slice(None)
+
+    zeros = np.zeros(len(grid))
+    pv, hp, dhw = (
+        np.nan_to_num(aligned[key][i0:i1][valid]).clip(min=0)
+        if key in aligned
+        else zeros
+        for key in ("pv", "hp", "dhw")
+    )
 
     # Derive base consumption: grid + pv - hp - dhw
-    consumption = (grid + pv - hp - dhw).clip(lower=0)
+    consumption = (grid + pv - hp - dhw).clip(min=0)
 
     return {
-        "index": common_idx,
-        "grid": grid.values,
-        "pv": pv.values,
-        "hp": hp.values,
-        "dhw": dhw.values,
-        "consumption": consumption.values,
-        "price": price.values,
-        "net_load": grid.values,  # grid = net load (positive=import)
+        "index": index,
+        "grid": grid,
+        "pv": pv,
+        "hp": hp,
+        "dhw": dhw,
+        "consumption": consumption,
+        "price": price,
+        "net_load": grid,  # grid = net load (positive=import)
     }
 
 
@@ -129,23 +264,26 @@ def generate_forecast(
     config: dict,
     day: pd.Timestamp,
     actuals: dict[str, np.ndarray],
+    weather: pd.DataFrame,
 ) -> dict[str, np.ndarray]:
     """Generate ML forecasts for one day, mimicking what the live controller does."""
-    loc = config["location"]
     capacity = config["pv_system"]["capacity_kwp"]
     idx = actuals["index"]
     T = len(idx)
 
-    # Load weather for this day
-    cache_dir = project_root() / "input" / "weather"
-    day_date = day.date() if hasattr(day, 'date') else day
-    weather_df = fetch_historical(
-        loc["latitude"], loc["longitude"],
-        day_date, day_date,
-        cache_dir,
-    )
+    # Slice this day out of the pre-fetched weather range
+    ts = weather["timestamp"]
+    day_end = day + ONE_DAY
+    weather_df = weather.iloc[ts.searchsorted(day) : ts.searchsorted(day_end)]
     if weather_df.empty:
-        raise ValueError(f"No weather data for {day_date}")
+        raise ValueError(f"No weather data for {day.date()}")
+
+    # Align weather rows to the actual-data hours once, so every feature
+    # builder output is already on idx (one nearest-reindex instead of four)
+    w = weather_df.set_index("timestamp")
+    if not w.index.equals(idx):
+        w = w.reindex(idx, method="nearest")
+    weather_df = w.rename_axis("timestamp").reset_index()
 
     # --- PV ---
     pv_features = build_pv_features(weather_df, config)
@@ -154,22 +292,19 @@ def generate_forecast(
 
     # --- Consumption (2-pass autoregressive) ---
     cons_features = build_consumption_features(weather_df, config)
-    cons_features = cons_features.reindex(idx, method="nearest")
     # First pass with default lag
     cons_features["load_lag_1h"] = 300.0
     pass1 = predict_model(models["consumption"], cons_features).clip(min=0)
-    # Second pass with shifted predictions
-    cons_features["load_lag_1h"] = pd.Series(pass1, index=idx).shift(1).bfill()
-    # Use actual prior-hour load if available
+    # Second pass with shifted predictions; seed with the actual prior-hour
+    # load before the column assignment to skip pandas setitem machinery
+    load_lag = _lagged(pass1, 1)
     if len(actuals["consumption"]) > 0:
-        cons_features.iloc[0, cons_features.columns.get_loc("load_lag_1h")] = (
-            actuals["consumption"][0]
-        )
+        load_lag[0] = actuals["consumption"][0]
+    cons_features["load_lag_1h"] = load_lag
     cons_pred = predict_model(models["consumption"], cons_features).clip(min=0)
 
     # --- Heat Pump ---
     hp_features = build_heating_features(weather_df, config)
-    hp_features = hp_features.reindex(idx, method="nearest")
     if "temp_min" not in hp_features.columns:
         hp_features["temp_min"] = hp_features["temperature"]
     hp_pred = predict_model(models["heat_pump"], hp_features).clip(min=0)
@@ -180,20 +315,16 @@ def generate_forecast(
 
     # --- Spot Price (2-pass autoregressive) ---
     sp_features = build_spot_price_features(weather_df, config)
-    sp_features = sp_features.reindex(idx, method="nearest")
     sp_features["price_lag_1h"] = 0.4
     sp_features["price_lag_24h"] = 0.4
     sp_features["price_rolling_24h_mean"] = 0.4
     pass1_price = predict_model(models["spot_price"], sp_features)
-    price_s = pd.Series(pass1_price, index=idx)
-    sp_features["price_lag_1h"] = price_s.shift(1).bfill()
-    sp_features["price_lag_24h"] = price_s.shift(24).bfill()
-    sp_features["price_rolling_24h_mean"] = price_s.rolling(24, min_periods=1).mean()
-    # Use actual prior prices as lags where available
+    price_lag = _lagged(pass1_price, 1)
     if len(actuals["price"]) > 0:
-        sp_features.iloc[0, sp_features.columns.get_loc("price_lag_1h")] = (
-            actuals["price"][0]
-        )
+        price_lag[0] = actuals["price"][0]
+    sp_features["price_lag_1h"] = price_lag
+    sp_features["price_lag_24h"] = _lagged(pass1_price, 24)
+    sp_features["price_rolling_24h_mean"] = _rolling_mean(pass1_price, 24)
     sp_pred = predict_model(models["spot_price"], sp_features)
 
     # Compute forecast net load
@@ -279,22 +410,53 @@ def run_backtest(
     if price_series is None or price_series.empty:
         raise ValueError("No spot price data available")
     data_end = min(grid_series.index.max(), price_series.index.max())
-    end_date = data_end.normalize() + pd.Timedelta(days=1)
-    start_date = end_date - pd.Timedelta(days=n_days)
+    end_date = data_end.normalize() + ONE_DAY
+    start_date = end_date - n_days * ONE_DAY
+
+    aligned = align_hourly(hourly)
+
+    # One weather fetch for the whole backtest range instead of one per day
+    loc = config["location"]
+    weather = fetch_historical(
+        loc["latitude"], loc["longitude"],
+        start_date.date(), (end_date - ONE_DAY).date(),
+        project_root() / "input" / "weather",
+    )
 
-    print(f"\nBacktest period: {start_date.date()} to {(end_date - pd.Timedelta(days=1)).date()}")
+    print(f"\nBacktest period: {start_date.date()} to {(end_date - ONE_DAY).date()}")
     print()
 
-    cost_results = []
-    accuracy_results = []
+    # Preallocated per-day result columns (n_days is known up front);
+    # avoids building a throwaway dict per day for pd.DataFrame()
+    date_arr = np.empty(n_days, dtype=object)
+    hours_arr = np.empty(n_days, dtype=np.int64)
+    no_batt_arr = np.empty(n_days)
+    perfect_arr = np.empty(n_days)
+    mpc_arr = np.empty(n_days)
+    mpc_prices_arr = np.empty(n_days)
+    n_done = 0
+
+    plot_executor = ThreadPoolExecutor(max_workers=2) if do_plot else None
+
+    # Per-model prediction/actual arrays, reduced to metrics after the loop
+    model_specs = [
+        ("PV", "pv", "W"),
+        ("Consumption", "consumption", "W"),
+        ("Heat Pump", "hp", "W"),
+        ("DHW", "dhw", "W"),
+        ("Spot Price", "price", "PLN/kWh"),
+    ]
+    acc_dates: list[str] = []
+    acc_preds: dict[str, list[np.ndarray]] = {name: [] for name, _, _ in model_specs}
+    acc_actuals: dict[str, list[np.ndarray]] = {name: [] for name, _, _ in model_specs}
 
     day = start_date
     while day < end_date:
         day_str = day.strftime("%Y-%m-%d")
-        actuals = get_day_actuals(hourly, day)
+        actuals = get_day_actuals(aligned, day)
 
         if actuals is None:
-            day += pd.Timedelta(days=1)
+            day += ONE_DAY
             continue
 
         T = len(actuals["index"])
@@ -302,10 +464,10 @@ def run_backtest(
 
         # Generate ML forecast
         try:
-            forecast = generate_forecast(models, config, day, actuals)
+            forecast = generate_forecast(models, config, day, actuals, weather)
         except Exception as e:
             print(f"  {day_str}: forecast failed ({e}), skipping")
-            day += pd.Timedelta(days=1)
+            day += ONE_DAY
             continue
 
         # --- 4 Scenarios ---
@@ -335,36 +497,19 @@ def run_backtest(
             mpc_opt, actuals["net_load"], actuals["price"], params, initial_soc
         )
 
-        cost_results.append({
-            "date": day_str,
-            "hours": T,
-            "no_batt_pln": no_batt.total_cost_pln,
-            "perfect_pln": perfect.total_cost_pln,
-            "mpc_pln": mpc_cost.total_cost_pln,
-            "mpc_prices_pln": mpc_prices_cost.total_cost_pln,
-        })
-
-        # Model accuracy for this day
-        for model_name, pred_key, actual_key, unit in [
-            ("PV", "pv", "pv", "W"),
-            ("Consumption", "consumption", "consumption", "W"),
-            ("Heat Pump", "hp", "hp", "W"),
-            ("DHW", "dhw", "dhw", "W"),
-            ("Spot Price", "price", "price", "PLN/kWh"),
-        ]:
-            pred = forecast[pred_key]
-            actual = actuals[actual_key]
-            mae = float(np.mean(np.abs(pred - actual)))
-            pred_kwh = float(np.sum(pred)) / 1000 if unit == "W" else float(np.mean(pred))
-            actual_kwh = float(np.sum(actual)) / 1000 if unit == "W" else float(np.mean(actual))
-            accuracy_results.append({
-                "date": day_str,
-                "model": model_name,
-                "mae": mae,
-                "pred_daily": pred_kwh,
-                "actual_daily": actual_kwh,
-                "unit": unit,
-            })
+        date_arr[n_done] = day_str
+        hours_arr[n_done] = T
+        no_batt_arr[n_done] = no_batt.total_cost_pln
+        perfect_arr[n_done] = perfect.total_cost_pln
+        mpc_arr[n_done] = mpc_cost.total_cost_pln
+        mpc_prices_arr[n_done] = mpc_prices_cost.total_cost_pln
+        n_done += 1
+
+        # Stash raw arrays; accuracy metrics are vectorized after the loop
+        acc_dates.append(day_str)
+        for model_name, key, _unit in model_specs:
+            acc_preds[model_name].append(forecast[key])
+            acc_actuals[model_name].append(actuals[key])
 
         print(
             f"  {day_str}: no_batt={no_batt.total_cost_pln:6.2f}  "
@@ -373,12 +518,72 @@ def run_backtest(
             f"full_fcst={mpc_cost.total_cost_pln:6.2f}"
         )
 
-        if do_plot:
-            plot_day(day_str, actuals, forecast, perfect, mpc_cost, mpc_prices_cost, params)
+        if plot_executor is not None:
+            # PNG encode + write is ~hundreds of ms; overlap it with the
+            # next day's forecast (each plot_day builds its own figure)
+            plot_executor.submit(
+                plot_day, day_str, actuals, forecast,
+                perfect, mpc_cost, mpc_prices_cost, params,
+            )
+
+        day += ONE_DAY
+
+    if plot_executor is not None:
+        plot_executor.shutdown(wait=True)
+
+    cost_df = pd.DataFrame({
+        "date": date_arr[:n_done],
+        "hours": hours_arr[:n_done],
+        "no_batt_pln": no_batt_arr[:n_done],
+        "perfect_pln": perfect_arr[:n_done],
+        "mpc_pln": mpc_arr[:n_done],
+        "mpc_prices_pln": mpc_prices_arr[:n_done],
+    })
+
+    return cost_df, _build_accuracy_df(
+        acc_dates, model_specs, acc_preds, acc_actuals
+    )
 
-        day += pd.Timedelta(days=1)
 
-    return pd.DataFrame(cost_results), pd.DataFrame(accuracy_results)
+def _build_accuracy_df(
+    dates: list[str],
+    model_specs: list[tuple[str, str, str]],
+    preds: dict[str, list[np.ndarray]],
+    actuals: dict[str, list[np.ndarray]],
+) -> pd.DataFrame:
+    """Compute per-day MAE and daily totals for each model in one pass.
+
+    Days can have different hour counts, so arrays are concatenated and
+    reduced per-day with np.add.reduceat instead of stacking.
+    """
+    if not dates:
+        return pd.DataFrame()
+
+    frames = []
+    for model_name, _key, unit in model_specs:
+        pred_cat = np.concatenate(preds[model_name])
+        actual_cat = np.concatenate(actuals[model_name])
+        counts = np.array([len(a) for a in actuals[model_name]])
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        mae = np.add.reduceat(np.abs(pred_cat - actual_cat), offsets) / counts
+        if unit == "W":
+            pred_daily = np.add.reduceat(pred_cat, offsets) / 1000
+            actual_daily = np.add.reduceat(actual_cat, offsets) / 1000
+        else:
+            pred_daily = np.add.reduceat(pred_cat, offsets) / counts
+            actual_daily = np.add.reduceat(actual_cat, offsets) / counts
+
+        frames.append(pd.DataFrame({
+            "date": dates,
+            "model": model_name,
+            "mae": mae,
+            "pred_daily": pred_daily,
+            "actual_daily": actual_daily,
+            "unit": unit,
+        }))
+
+    return pd.concat(frames, ignore_index=True)
 
 
 def _simulate_schedule_on_actuals(
@@ -404,17 +609,35 @@ def _simulate_schedule_on_actuals(
     soc = np.zeros(T)
     current_soc = initial_soc_wh
 
-    for t in range(T):
-        # Clamp planned schedule to actual SoC limits
-        planned_charge = opt_result.charge_w[t] if t < len(opt_result.charge_w) else 0
-        planned_discharge = opt_result.discharge_w[t] if t < len(opt_result.discharge_w) else 0
-
-        # Feasibility: can we actually charge/discharge this much?
-        max_charge = (params.soc_max_wh - current_soc) / eta
-        max_discharge = (current_soc - params.soc_min_wh) * eta
+    # Hoist attribute reads out of the hot loop
+    soc_min = params.soc_min_wh
+    soc_max = params.soc_max_wh
+    max_p = params.max_power_w
+    inv_eta = 1.0 / eta
+    charge_plan = opt_result.charge_w
+    discharge_plan = opt_result.discharge_w
+    plan_len = len(charge_plan)
 
-        c = min(max(planned_charge, 0), params.max_power_w, max_charge)
-        d = min(max(planned_discharge, 0), params.max_power_w, max_discharge)
+    for t in range(T):
+        # Clamp planned schedule to actual SoC limits; explicit branches
+        # instead of min()/max() builtins keep this loop cheap
+        c = charge_plan[t] if t < plan_len else 0.0
+        if c < 0.0:
+            c = 0.0
+        elif c > max_p:
+            c = max_p
+        max_charge = (soc_max - current_soc) * inv_eta
+        if c > max_charge:
+            c = max_charge
+
+        d = discharge_plan[t] if t < plan_len else 0.0
+        if d < 0.0:
+            d = 0.0
+        elif d > max_p:
+            d = max_p
+        max_discharge = (current_soc - soc_min) * eta
+        if d > max_discharge:
+            d = max_discharge
 
         # If both charge and discharge planned, pick the larger
         if c > 0 and d > 0:
@@ -425,7 +648,7 @@ def _simulate_schedule_on_actuals(
 
         charge[t] = c
         discharge[t] = d
-        current_soc = current_soc + c * eta - d / eta
+        current_soc = current_soc + c * eta - d * inv_eta
         soc[t] = current_soc
 
         # Grid flows with actual net load
@@ -459,14 +682,21 @@ def print_accuracy(accuracy_df: pd.DataFrame):
     print(header)
     print("  " + "-" * (len(header) - 2))
 
+    agg = accuracy_df.groupby("model", sort=False).agg(
+        mae=("mae", "mean"),
+        pred=("pred_daily", "mean"),
+        actual=("actual_daily", "mean"),
+        unit=("unit", "first"),
+    )
+
     for model_name in ("PV", "Consumption", "Heat Pump", "DHW", "Spot Price"):
-        rows = accuracy_df[accuracy_df["model"] == model_name]
-        if rows.empty:
+        if model_name not in agg.index:
             continue
-        mae = rows["mae"].mean()
-        pred = rows["pred_daily"].mean()
-        actual = rows["actual_daily"].mean()
-        unit = rows["unit"].iloc[0]
+        row = agg.loc[model_name]
+        mae = row["mae"]
+        pred = row["pred"]
+        actual = row["actual"]
+        unit = row["unit"]
 
         if unit == "W":
             print(f"  {model_name:<14} {mae:>7.0f} W   {pred:>10.1f}        {actual:>10.1f}")
@@ -489,20 +719,18 @@ def print_cost_results(cost_df: pd.DataFrame):
     print(header)
     print("-" * len(header))
 
-    for _, row in cost_df.iterrows():
-        nb = row["no_batt_pln"]
-        perf = row["perfect_pln"]
-        mpc = row["mpc_pln"]
-        da = row["mpc_prices_pln"]
-
-        da_save = (1 - da / nb) * 100 if nb != 0 else 0
-        perf_save = (1 - perf / nb) * 100 if nb != 0 else 0
-        gap = perf_save - da_save
+    # Savings columns computed vectorially; iterrows builds a Series per row
+    nb_col = cost_df["no_batt_pln"].to_numpy()
+    denom = np.where(nb_col != 0, nb_col, np.nan)
+    da_saves = np.nan_to_num((1 - cost_df["mpc_prices_pln"].to_numpy() / denom) * 100)
+    perf_saves = np.nan_to_num((1 - cost_df["perfect_pln"].to_numpy() / denom) * 100)
+    gaps = perf_saves - da_saves
 
+    for i, row in enumerate(cost_df.itertuples(index=False)):
         print(
-            f"{row['date']:<12} {nb:>8.2f} {perf:>8.2f} "
-            f"{da:>9.2f} {mpc:>9.2f}  "
-            f"{da_save:>+7.1f}% {perf_save:>+9.1f}% {gap:>+5.1f}%"
+            f"{row.date:<12} {row.no_batt_pln:>8.2f} {row.perfect_pln:>8.2f} "
+            f"{row.mpc_prices_pln:>9.2f} {row.mpc_pln:>9.2f}  "
+            f"{da_saves[i]:>+7.1f}% {perf_saves[i]:>+9.1f}% {gaps[i]:>+5.1f}%"
         )
 
     print("-" * len(header))
@@ -545,9 +773,12 @@ def plot_day(
     mpc_prices,
     params: BatteryParams,
 ):
-    """Generate per-day comparison plot."""
+    """Generate per-day comparison plot. Safe to run off the main thread."""
     try:
-        import matplotlib.pyplot as plt
+        # Build the figure directly instead of via pyplot: pyplot's global
+        # "current figure" registry is shared across threads, so two plot
+        # jobs in flight could save/close each other's figures
+        from matplotlib.figure import Figure
     except ImportError:
         print("  matplotlib not available, skipping plot")
         return
@@ -560,7 +791,8 @@ def plot_day(
     T = len(actuals["index"])
     hours = np.arange(T)
 
-    fig, axes = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
+    fig = Figure(figsize=(14, 10))
+    axes = fig.subplots(3, 1, sharex=True)
 
     # Row 1: SoC traces
     ax = axes[0]
@@ -605,11 +837,10 @@ def plot_day(
     ax.legend(loc="upper left", fontsize=8)
     ax2.legend(loc="upper right", fontsize=8)
 
-    plt.tight_layout()
+    fig.tight_layout()
     out_path = out_dir / f"backtest_mpc_{day_str}.png"
-    plt.savefig(str(out_path), dpi=150)
+    fig.savefig(out_path, dpi=150)
     print(f"  Saved plot: {out_path}")
-    plt.close()
 
 
 def main():
@@ -20,6 +20,9 @@ Usage:
 """
 
 import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
@@ -27,7 +30,12 @@ import pandas as pd
 
 from .backtest import load_data
 from .config import load_config, project_root
-from .optimize import BatteryParams, optimize_battery, simulate_no_battery
+from .optimize import (
+    BatteryParams,
+    no_battery_daily_costs,
+    optimize_battery_batch,
+    precompute_days,
+)
 
 # ── Hardware constants ──────────────────────────────────────────────────────
 
@@ -123,15 +131,17 @@ def generate_pylontech_configs(max_towers: int = 2) -> list[HardwareConfig]:
 # ── Optimization engine ────────────────────────────────────────────────────
 
 def run_config(
-    hourly: pd.DataFrame,
+    days: list[tuple[pd.Timestamp, np.ndarray, np.ndarray]],
     config: HardwareConfig,
-    start: pd.Timestamp,
-    end: pd.Timestamp,
     soc_min_pct: float = 10,
     soc_max_pct: float = 90,
     export_coeff: float = 0.8,
 ) -> dict:
-    """Run LP optimization for a single hardware configuration."""
+    """Run LP optimization for a single hardware configuration.
+
+    Takes day slices from precompute_days so every config shares the
+    same arrays instead of re-slicing the hourly frame.
+    """
     capacity_wh = config.capacity_kwh * 1000
     params = BatteryParams(
         capacity_wh=capacity_wh,
@@ -141,31 +151,11 @@ def run_config(
         export_coeff=export_coeff,
     )
 
-    total_no_batt = 0.0
-    total_opt = 0.0
-    day_count = 0
-    day = start
-
-    while day < end:
-        day_end = day + pd.Timedelta(days=1)
-        mask = (hourly.index >= day) & (hourly.index < day_end)
-        day_data = hourly[mask]
-
-        if len(day_data) < 20:
-            day = day_end
-            continue
-
-        net_load = day_data["net_load_w"].values
-        price = day_data["price_pln_kwh"].values
-        initial_soc = params.soc_min_wh
-
-        no_batt = simulate_no_battery(net_load, price, export_coeff)
-        opt = optimize_battery(net_load, price, params, initial_soc)
-
-        total_no_batt += no_batt.total_cost_pln
-        total_opt += opt.total_cost_pln
-        day_count += 1
-        day = day_end
+    # No-battery costs are hourly-independent: one vectorized pass
+    total_no_batt = float(no_battery_daily_costs(days, export_coeff).sum())
+    # All daily LPs stack into one block-diagonal solve
+    total_opt = float(optimize_battery_batch(days, params).sum())
+    day_count = len(days)
 
     total_savings = total_no_batt - total_opt
     annual_savings = total_savings * 365.25 / day_count if day_count > 0 else 0
@@ -186,6 +176,30 @@ def run_config(
     }
 
 
+# Day slices are shipped to each worker once via the pool initializer
+# instead of being re-pickled with every submitted config
+_worker_days: list | None = None
+
+
+def _init_worker(days: list) -> None:
+    global _worker_days
+    _worker_days = days
+
+
+def _run_config_worker(
+    config: HardwareConfig,
+    soc_min_pct: float,
+    soc_max_pct: float,
+    export_coeff: float,
+) -> dict:
+    return run_config(
+        _worker_days, config,
+        soc_min_pct=soc_min_pct,
+        soc_max_pct=soc_max_pct,
+        export_coeff=export_coeff,
+    )
+
+
 # ── Main ────────────────────────────────────────────────────────────────────
 
 def main():
@@ -237,22 +251,68 @@ def main():
     print(f"Inverter: Deye {INVERTER_MAX_POWER_W}W ({INVERTER_COST_PLN} PLN, shared)")
     print(f"Configurations: {len(configs)} total\n")
 
-    # Run all configs
+    # Slice days once; every config reuses the same arrays
+    days = precompute_days(hourly, start, end)
+
+    # The LP depends only on capacity and power; brand/tower shapes with
+    # identical numbers (e.g. Dyness 2x3 vs 1x6) share one solve
+    groups: dict[tuple, list[HardwareConfig]] = {}
+    for hw in configs:
+        key = (round(hw.capacity_kwh * 1000), hw.max_power_w)
+        groups.setdefault(key, []).append(hw)
+
+    # Run unique optimization keys in parallel
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(days,),
+    ) as pool:
+        futures = {
+            key: pool.submit(
+                _run_config_worker, members[0],
+                args.soc_min, args.soc_max, args.export_coeff,
+            )
+            for key, members in groups.items()
+        }
+        shared_results = {key: fut.result() for key, fut in futures.items()}
+
+    # Fan the shared savings out to every member; only the hardware
+    # cost arithmetic differs within a group. Rows stream straight to
+    # CSV as they're produced so partial runs leave usable output.
+    out_csv = project_root() / "docs" / "forecast" / "battery_hw_roi.csv"
+    out_csv.parent.mkdir(parents=True, exist_ok=True)
+
     results = []
-    for i, hw in enumerate(configs):
-        print(f"  [{i+1}/{len(configs)}] {hw.label} ({hw.hardware_cost_pln:,.0f} PLN)...", end="", flush=True)
-        r = run_config(
-            hourly, hw, start, end,
-            soc_min_pct=args.soc_min,
-            soc_max_pct=args.soc_max,
-            export_coeff=args.export_coeff,
-        )
-        results.append(r)
-        print(f" savings {r['annual_savings']:,.0f} PLN/yr, payback {r['payback_years']:.1f}y")
+    with open(out_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "brand", "capacity_kwh", "towers", "modules_per_tower",
+            "hardware_cost_pln", "annual_savings_pln", "pln_per_kwh_yr",
+            "payback_years", "roi_pct",
+        ])
+        for i, hw in enumerate(configs):
+            shared = shared_results[(round(hw.capacity_kwh * 1000), hw.max_power_w)]
+            annual = shared["annual_savings"]
+            r = dict(shared)
+            r["config"] = hw
+            r["hardware_cost"] = hw.hardware_cost_pln
+            r["payback_years"] = hw.hardware_cost_pln / annual if annual > 0 else float("inf")
+            r["roi_pct"] = annual / hw.hardware_cost_pln * 100 if hw.hardware_cost_pln > 0 else 0
+            results.append(r)
+            writer.writerow([
+                hw.brand, f"{hw.capacity_kwh:.2f}", hw.towers, hw.modules_per_tower,
+                f"{hw.hardware_cost_pln:.2f}", f"{annual:.2f}",
+                f"{r['pln_per_kwh_yr']:.2f}", f"{r['payback_years']:.2f}",
+                f"{r['roi_pct']:.2f}",
+            ])
+            print(
+                f"  [{i+1}/{len(configs)}] {hw.label} ({hw.hardware_cost_pln:,.0f} PLN)"
+                f" savings {annual:,.0f} PLN/yr, payback {r['payback_years']:.1f}y"
+            )
 
-    # Sort by ROI
-    results.sort(key=lambda r: r["roi_pct"], reverse=True)
-    best = results[0]
+    print(f"\nSaved results to {out_csv}")
+
+    best = max(results, key=lambda r: r["roi_pct"])
 
     # Print table
     print(f"\n{'Brand':<10} {'Capacity':>9} {'Modules':>8} {'Cost':>10} {'Savings/yr':>11} {'PLN/kWh/yr':>11} {'Payback':>9} {'ROI':>7}")
@@ -292,9 +352,11 @@ def _plot_comparison(results: list[dict]) -> None:
     plt.style.use("ggplot")
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
 
-    # Separate by brand
-    dyness = [r for r in results if r["config"].brand == "Dyness"]
-    pylontech = [r for r in results if r["config"].brand == "Pylontech"]
+    # Separate by brand in one pass
+    dyness: list[dict] = []
+    pylontech: list[dict] = []
+    for r in results:
+        (dyness if r["config"].brand == "Dyness" else pylontech).append(r)
 
     # --- Left: Payback years vs capacity ---
     for brand_results, color, marker in [
@@ -339,12 +401,18 @@ def _plot_comparison(results: list[dict]) -> None:
                 fontsize=7, color=color,
             )
 
-    # Add break-even lines
+    # Add break-even lines as one collection (they're straight lines,
+    # so two points per segment suffice)
+    from matplotlib.collections import LineCollection
+
     max_cost = max(r["hardware_cost"] for r in results) * 1.1
-    for years in [5, 10, 15, 20]:
-        x = np.linspace(0, max_cost, 100)
-        y = x / years
-        ax2.plot(x, y, "--", color="gray", alpha=0.3, linewidth=0.8)
+    payback_years = np.array([5, 10, 15, 20])
+    x = np.array([0.0, max_cost])
+    segments = [np.column_stack([x, x / years]) for years in payback_years]
+    ax2.add_collection(LineCollection(
+        segments, colors="gray", alpha=0.3, linewidths=0.8, linestyles="--",
+    ))
+    for years in payback_years:
         ax2.annotate(
             f"{years}y payback", (max_cost * 0.9, max_cost * 0.9 / years),
             fontsize=7, color="gray",
@@ -6,50 +6,35 @@ Usage:
 """
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
 
 from .backtest import load_data
 from .config import load_config, project_root
-from .optimize import BatteryParams, optimize_battery, simulate_no_battery
+from .optimize import (
+    BatteryParams,
+    no_battery_daily_costs,
+    optimize_battery_batch,
+    precompute_days,
+)
 
 
 def _run_period(
-    hourly: pd.DataFrame,
+    days: list[tuple[pd.Timestamp, np.ndarray, np.ndarray]],
     params: BatteryParams,
-    start: pd.Timestamp,
-    end: pd.Timestamp,
 ) -> pd.DataFrame:
-    """Run day-by-day LP optimal + no-battery over [start, end), return daily results."""
-    results = []
-    day = start
-
-    while day < end:
-        day_end = day + pd.Timedelta(days=1)
-        mask = (hourly.index >= day) & (hourly.index < day_end)
-        day_data = hourly[mask]
-
-        if len(day_data) < 20:
-            day = day_end
-            continue
-
-        net_load = day_data["net_load_w"].values
-        price = day_data["price_pln_kwh"].values
-        initial_soc = params.soc_min_wh
-
-        no_batt = simulate_no_battery(net_load, price, params.export_coeff)
-        opt = optimize_battery(net_load, price, params, initial_soc)
-
-        results.append({
-            "date": day,
-            "no_batt_pln": no_batt.total_cost_pln,
-            "opt_pln": opt.total_cost_pln,
-        })
-
-        day = day_end
+    """Run LP optimal + no-battery over precomputed day slices."""
+    if not days:
+        return pd.DataFrame()
 
-    return pd.DataFrame(results)
+    return pd.DataFrame({
+        "date": [day for day, _nl, _p in days],
+        "no_batt_pln": no_battery_daily_costs(days, params.export_coeff),
+        "opt_pln": optimize_battery_batch(days, params),
+    })
 
 
 def _parse_date_range(
@@ -93,7 +78,7 @@ def cmd_analyze(args):
     print(f"\nBattery: {args.capacity} kWh, {args.power} W | Cost: {investment:,.0f} PLN")
     print(f"Period: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')} ({total_days} days)")
 
-    daily = _run_period(hourly, params, start, end)
+    daily = _run_period(precompute_days(hourly, start, end), params)
 
     if daily.empty:
         print("No days with sufficient data!")
@@ -201,6 +186,28 @@ def _plot_analyze(
 
 # ── sweep ────────────────────────────────────────────────────────────────────
 
+# Day slices are installed once per worker via the pool initializer
+_sweep_days: list | None = None
+
+
+def _init_sweep_worker(days: list) -> None:
+    global _sweep_days
+    _sweep_days = days
+
+
+def _run_one_capacity(task: tuple) -> float:
+    """Total LP-optimal cost for one capacity step (runs in a worker)."""
+    cap_kwh, c_rate, soc_min, soc_max, export_coeff = task
+    capacity_wh = cap_kwh * 1000
+    params = BatteryParams(
+        capacity_wh=capacity_wh,
+        max_power_w=capacity_wh * c_rate,
+        soc_min_wh=capacity_wh * soc_min / 100,
+        soc_max_wh=capacity_wh * soc_max / 100,
+        export_coeff=export_coeff,
+    )
+    return float(optimize_battery_batch(_sweep_days, params).sum())
+
 
 def cmd_sweep(args):
     config = load_config()
@@ -213,26 +220,34 @@ def cmd_sweep(args):
     print(f"Period: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')} ({total_days} days)")
 
     capacities = np.arange(args.min_capacity, args.max_capacity + args.step * 0.5, args.step)
-    rows = []
-
-    for cap_kwh in capacities:
-        capacity_wh = cap_kwh * 1000
-        power_w = capacity_wh * args.c_rate
-        params = BatteryParams(
-            capacity_wh=capacity_wh,
-            max_power_w=power_w,
-            soc_min_wh=capacity_wh * args.soc_min / 100,
-            soc_max_wh=capacity_wh * args.soc_max / 100,
-            export_coeff=args.export_coeff,
-        )
 
-        daily = _run_period(hourly, params, start, end)
-        actual_days = len(daily)
+    # Day slices and the no-battery baseline don't depend on capacity;
+    # only the LP solves vary across the sweep
+    days = precompute_days(hourly, start, end)
+    actual_days = len(days)
+    total_no_batt = float(no_battery_daily_costs(days, args.export_coeff).sum())
+    rows = []
 
-        if actual_days == 0:
-            continue
+    if actual_days == 0:
+        print("No results!")
+        return
 
-        total_savings = daily["no_batt_pln"].sum() - daily["opt_pln"].sum()
+    # Capacity steps are independent full-period solves — fan them out
+    # across processes and keep the original ordering
+    tasks = [
+        (cap_kwh, args.c_rate, args.soc_min, args.soc_max, args.export_coeff)
+        for cap_kwh in capacities
+    ]
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_sweep_worker,
+        initargs=(days,),
+    ) as pool:
+        opt_totals = list(pool.map(_run_one_capacity, tasks))
+
+    for cap_kwh, total_opt in zip(capacities, opt_totals):
+        power_w = cap_kwh * 1000 * args.c_rate
+        total_savings = total_no_batt - total_opt
         annual_savings = total_savings * 365.25 / actual_days
         investment = cap_kwh * args.cost_per_kwh
         pln_kwh_yr = annual_savings / cap_kwh if cap_kwh > 0 else 0
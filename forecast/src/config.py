@@ -1,16 +1,23 @@
 """Load and provide typed access to config.yaml."""
 
+import functools
+from copy import deepcopy
 from pathlib import Path
 
 import yaml
 
+# LibYAML's C tokenizer when the wheel ships it; same safe-load semantics
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-def load_config(path: Path | None = None) -> dict:
-    """Load config.yaml and return as dict with defaults merged."""
-    if path is None:
-        path = Path(__file__).parent.parent / "config.yaml"
+
+@functools.lru_cache(maxsize=None)
+def _load_config_cached(path: Path) -> dict:
+    """Parse and merge config.yaml once per path; load_config copies it out."""
     with open(path) as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=_YamlLoader)
 
     # Merge per-model configs with default_params
     defaults = cfg["models"]["default_params"]
@@ -27,11 +34,24 @@ def load_config(path: Path | None = None) -> dict:
     return cfg
 
 
+def load_config(path: Path | None = None) -> dict:
+    """Load config.yaml and return as dict with defaults merged.
+
+    Parsing and merging are cached per path; callers get a deep copy so
+    local tweaks can't leak into later loads.
+    """
+    if path is None:
+        path = Path(__file__).parent.parent / "config.yaml"
+    return deepcopy(_load_config_cached(path))
+
+
+@functools.lru_cache(maxsize=1)
 def project_root() -> Path:
     """Return the energy_simulator project root directory."""
     return Path(__file__).parent.parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def python_root() -> Path:
     """Return the forecast/ directory."""
     return Path(__file__).parent.parent
@@ -10,13 +10,22 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
+import joblib
 import numpy as np
 import pandas as pd
 
 from .config import load_config, python_root
 from .features import (
+    _lagged,
+    _rolling_mean,
     build_pv_features,
     build_consumption_features,
     build_heating_features,
@@ -27,17 +36,87 @@ from .models.lightgbm_model import LightGBMModel
 from .optimize import BatteryParams, optimize_battery, simulate_no_battery
 from .weather import fetch_forecast
 
+ONE_HOUR = pd.Timedelta(hours=1)
+
 
 class ForecastCache:
-    """Cache weather + model predictions, refresh when stale."""
+    """Cache weather + model predictions, refresh when stale.
+
+    Backed by a disk tier with the same TTL, so a restarted controller
+    reuses the previous process's still-fresh forecasts instead of
+    refetching weather and rerunning all five models on startup.
+    """
 
     def __init__(self, ttl_minutes: int = 60):
         self.ttl = ttl_minutes
         self._predictions: dict | None = None
         self._fetched_at: pd.Timestamp | None = None
+        # get_predictions may be called from the prefetch thread
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _disk_paths() -> tuple[Path, Path]:
+        cache_dir = python_root() / "cache"
+        return cache_dir / "forecasts.joblib", cache_dir / "forecasts.json"
+
+    @staticmethod
+    def _cache_key(config: dict, horizon_hours: int) -> str:
+        """Fingerprint of everything the predictions depend on."""
+        raw = json.dumps(
+            {
+                "config": config,
+                "horizon": horizon_hours,
+                "models": _model_dir_signature(python_root() / "models"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _load_disk(self, key: str, now: pd.Timestamp) -> dict | None:
+        payload_path, manifest_path = self._disk_paths()
+        if not (payload_path.exists() and manifest_path.exists()):
+            return None
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if manifest.get("key") != key:
+            return None
+        fetched_at = pd.Timestamp(manifest["fetched_at"])
+        if (now - fetched_at).total_seconds() >= self.ttl * 60:
+            return None
+        try:
+            self._predictions = joblib.load(payload_path)
+        except Exception:
+            return None
+        self._fetched_at = fetched_at
+        return self._predictions
+
+    def _store_disk(self, key: str, now: pd.Timestamp) -> None:
+        payload_path, manifest_path = self._disk_paths()
+        payload_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a torn file
+        tmp_path = payload_path.with_suffix(".joblib.tmp")
+        joblib.dump(self._predictions, tmp_path)
+        tmp_path.replace(payload_path)
+        with open(manifest_path, "w") as f:
+            json.dump({"key": key, "fetched_at": str(now)}, f)
 
     def get_predictions(self, config: dict, horizon_hours: int) -> dict:
         """Return cached predictions, re-fetch if stale."""
+        with self._lock:
+            return self._get_predictions_locked(config, horizon_hours)
+
+    def seconds_until_stale(self) -> float:
+        """Seconds until the in-memory predictions expire (0 if already stale)."""
+        if self._fetched_at is None:
+            return 0.0
+        age = (pd.Timestamp.now(tz="UTC") - self._fetched_at).total_seconds()
+        return max(self.ttl * 60 - age, 0.0)
+
+    def _get_predictions_locked(self, config: dict, horizon_hours: int) -> dict:
         now = pd.Timestamp.now(tz="UTC")
         if (
             self._fetched_at
@@ -45,6 +124,10 @@ class ForecastCache:
         ):
             return self._predictions
 
+        key = self._cache_key(config, horizon_hours)
+        if self._load_disk(key, now) is not None:
+            return self._predictions
+
         try:
             self._predictions = forecast_all(config, horizon_hours)
             self._fetched_at = now
@@ -54,25 +137,61 @@ class ForecastCache:
                 self._fetched_at = now  # extend TTL
             else:
                 raise
+        else:
+            try:
+                self._store_disk(key, now)
+            except OSError as e:
+                print(f"  Warning: forecast disk cache write failed ({e})")
 
         return self._predictions
 
 
-def _load_models() -> dict[str, LightGBMModel]:
-    """Load all 5 models from disk."""
-    model_dir = python_root() / "models"
+def _model_dir_signature(model_dir: Path) -> tuple:
+    """Stat-based fingerprint so the model cache invalidates on retrain."""
+    return tuple(
+        sorted((f.name, f.stat().st_mtime_ns) for f in model_dir.glob("*_model.*"))
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_models_cached(model_dir: str, signature: tuple) -> dict[str, LightGBMModel]:
     models = {}
     for name in ("pv", "consumption", "heat_pump", "spot_price", "dhw"):
-        models[name] = LightGBMModel.load(str(model_dir / f"{name}_model"))
+        models[name] = LightGBMModel.load(f"{model_dir}/{name}_model")
     return models
 
 
+def _load_models() -> dict[str, LightGBMModel]:
+    """Load all 5 models, reusing them until the files on disk change.
+
+    forecast_all runs on every cache refresh; re-reading five boosters
+    each hour was pure repeated I/O.
+    """
+    model_dir = python_root() / "models"
+    return _load_models_cached(str(model_dir), _model_dir_signature(model_dir))
+
+
+_feature_positions: dict[tuple, list[int]] = {}
+
+
 def _predict_model(
     model: LightGBMModel, features: pd.DataFrame
 ) -> np.ndarray:
-    """Predict using only the features the model was trained with."""
-    expected = model.feature_names
-    return model.predict(features[expected])
+    """Predict via the native booster using only the trained features.
+
+    Skips the sklearn wrapper's per-call validation; num_threads=1 avoids
+    OpenMP dispatch overhead on horizon-sized (24-row) batches. Column
+    positions are memoized so repeated cycles skip the per-name
+    get_loc lookups and the DataFrame column-subset copy.
+    """
+    key = (tuple(model.feature_names), tuple(features.columns))
+    positions = _feature_positions.get(key)
+    if positions is None:
+        positions = [features.columns.get_loc(n) for n in model.feature_names]
+        _feature_positions[key] = positions
+
+    X = features.to_numpy(dtype=np.float32)[:, positions]
+    return model.booster.predict(X, num_threads=1)
 
 
 def forecast_all(config: dict, horizon: int) -> dict:
@@ -93,70 +212,86 @@ def forecast_all(config: dict, horizon: int) -> dict:
     now = pd.Timestamp.now(tz="UTC").floor("h")
     full_idx = pd.date_range(now, periods=horizon, freq="h", tz="UTC")
 
-    # --- PV ---
+    # --- Feature frames ---
     pv_features = build_pv_features(weather_df, config)
-    pv_pred = (_predict_model(models["pv"], pv_features) * capacity).clip(
-        min=0
-    )
-    # PV features only cover daytime; fill nighttime with 0
-    pv_series = pd.Series(pv_pred, index=pv_features.index).reindex(
-        full_idx, fill_value=0.0
-    )
 
-    # --- Consumption (needs load_lag_1h: 2-pass autoregressive) ---
     cons_features = build_consumption_features(weather_df, config)
     cons_features = cons_features.reindex(full_idx, method="nearest")
     # First pass: use a reasonable default for lag
     cons_features["load_lag_1h"] = 300.0  # typical household average
-    pass1 = _predict_model(models["consumption"], cons_features).clip(min=0)
-    # Second pass: use shifted predictions as lag
-    cons_features["load_lag_1h"] = (
-        pd.Series(pass1, index=full_idx).shift(1).bfill()
-    )
-    cons_pred = _predict_model(models["consumption"], cons_features).clip(
-        min=0
-    )
-    cons_series = pd.Series(cons_pred, index=full_idx)
 
-    # --- Heat Pump ---
     hp_features = build_heating_features(weather_df, config)
     hp_features = hp_features.reindex(full_idx, method="nearest")
     # HP model trained at 6h resolution has temp_min feature
     if "temp_min" not in hp_features.columns:
         hp_features["temp_min"] = hp_features["temperature"]
-    hp_pred = _predict_model(models["heat_pump"], hp_features).clip(min=0)
-    hp_series = pd.Series(hp_pred, index=full_idx)
 
-    # --- Spot Price (needs price lags: 2-pass) ---
     sp_features = build_spot_price_features(weather_df, config)
     sp_features = sp_features.reindex(full_idx, method="nearest")
     # First pass: use typical averages for lags
     sp_features["price_lag_1h"] = 0.4
     sp_features["price_lag_24h"] = 0.4
     sp_features["price_rolling_24h_mean"] = 0.4
-    pass1_price = _predict_model(models["spot_price"], sp_features)
-    # Second pass: use shifted predictions as lags
-    price_s = pd.Series(pass1_price, index=full_idx)
-    sp_features["price_lag_1h"] = price_s.shift(1).bfill()
-    sp_features["price_lag_24h"] = price_s.shift(24).bfill()
-    sp_features["price_rolling_24h_mean"] = price_s.rolling(
-        24, min_periods=1
-    ).mean()
+
+    dhw_features = build_dhw_features(full_idx, config, weather_df=weather_df)
+
+    # --- First-pass predictions (all independent) ---
+    # LightGBM releases the GIL inside predict, so threads overlap the
+    # tree traversal of the five boosters
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        pv_fut = pool.submit(_predict_model, models["pv"], pv_features)
+        cons_fut = pool.submit(_predict_model, models["consumption"], cons_features)
+        hp_fut = pool.submit(_predict_model, models["heat_pump"], hp_features)
+        sp_fut = pool.submit(_predict_model, models["spot_price"], sp_features)
+        dhw_fut = pool.submit(_predict_model, models["dhw"], dhw_features)
+
+    # --- PV ---
+    pv_pred = (pv_fut.result() * capacity).clip(min=0)
+    # PV features only cover daytime; fill nighttime with 0
+    pv_series = pd.Series(pv_pred, index=pv_features.index).reindex(
+        full_idx, fill_value=0.0
+    )
+
+    # --- Consumption (needs load_lag_1h: 2-pass autoregressive) ---
+    pass1 = cons_fut.result().clip(min=0)
+    # Second pass: use shifted predictions as lag
+    cons_features["load_lag_1h"] = _lagged(pass1, 1)
+    cons_pred = _predict_model(models["consumption"], cons_features).clip(
+        min=0
+    )
+    cons_series = pd.Series(cons_pred, index=full_idx)
+
+    # --- Heat Pump ---
+    hp_series = pd.Series(hp_fut.result().clip(min=0), index=full_idx)
+
+    # --- Spot Price (needs price lags: 2-pass) ---
+    pass1_price = sp_fut.result()
+    # Second pass: use shifted predictions as lags (numpy equivalents of
+    # shift().bfill() / rolling().mean() — no Series allocations)
+    sp_features["price_lag_1h"] = _lagged(pass1_price, 1)
+    sp_features["price_lag_24h"] = _lagged(pass1_price, 24)
+    sp_features["price_rolling_24h_mean"] = _rolling_mean(pass1_price, 24)
     sp_pred = _predict_model(models["spot_price"], sp_features)
     sp_series = pd.Series(sp_pred, index=full_idx)
 
     # --- DHW (needs temperature from weather) ---
-    dhw_features = build_dhw_features(full_idx, config, weather_df=weather_df)
-    dhw_pred = _predict_model(models["dhw"], dhw_features).clip(min=0)
-    dhw_series = pd.Series(dhw_pred, index=full_idx)
+    dhw_series = pd.Series(dhw_fut.result().clip(min=0), index=full_idx)
 
-    return {
+    forecasts = {
         "pv": pv_series,
         "consumption": cons_series,
         "heat_pump": hp_series,
         "dhw": dhw_series,
         "spot_price": sp_series,
     }
+    # Raw views for the per-cycle hot path: build_optimization_input
+    # slices these by integer offset instead of reindexing Series
+    forecasts["_start"] = full_idx[0]
+    forecasts["_arrays"] = {
+        name: forecasts[name].to_numpy() for name in
+        ("pv", "consumption", "heat_pump", "dhw", "spot_price")
+    }
+    return forecasts
 
 
 def build_optimization_input(
@@ -164,15 +299,29 @@ def build_optimization_input(
 ) -> tuple[np.ndarray, np.ndarray]:
     """Slice predictions from current_hour for horizon hours.
 
+    Works on the raw arrays cached by forecast_all: the window is a pure
+    integer-offset slice, replacing five pandas reindexes per MPC cycle.
+    Hours past the forecast end repeat the last value (PV: zero), which
+    matches the old nearest-reindex behaviour.
+
     Returns (net_load_w, price_pln_kwh) as numpy arrays.
     """
-    idx = pd.date_range(current_hour, periods=horizon, freq="h", tz="UTC")
-
-    consumption = forecasts["consumption"].reindex(idx, method="nearest").fillna(0).values
-    hp = forecasts["heat_pump"].reindex(idx, method="nearest").fillna(0).values
-    dhw = forecasts["dhw"].reindex(idx, method="nearest").fillna(0).values
-    pv = forecasts["pv"].reindex(idx, fill_value=0).values
-    price = forecasts["spot_price"].reindex(idx, method="nearest").fillna(0.4).values
+    arrays = forecasts["_arrays"]
+    off = max(int((current_hour - forecasts["_start"]) // ONE_HOUR), 0)
+
+    def window(name: str, edge_fill: float | None = None) -> np.ndarray:
+        a = arrays[name]
+        seg = a[off : off + horizon]
+        if len(seg) < horizon:
+            fill = edge_fill if edge_fill is not None else a[-1]
+            seg = np.concatenate([seg, np.full(horizon - len(seg), fill)])
+        return seg
+
+    consumption = window("consumption")
+    hp = window("heat_pump")
+    dhw = window("dhw")
+    pv = window("pv", edge_fill=0.0)
+    price = window("spot_price")
 
     net_load = consumption + hp + dhw - pv
     return net_load, price
@@ -210,15 +359,22 @@ def print_full_schedule(
     print(f"\n{horizon}h Optimal Schedule:")
     print(f"  {'Hour':<7} {'Price':>6} {'Action':<11} {'Power':>6} {'SoC':>15}")
 
+    # One vectorized tz conversion instead of a Timedelta + tz lookup per row
+    hours = (
+        pd.date_range(now, periods=len(net_load), freq="h", tz="UTC")
+        .tz_convert(timezone)
+        .strftime("%H:%M")
+    )
+    pct_scale = 100 / params.capacity_wh
+
     for t in range(len(net_load)):
-        ts = (now + pd.Timedelta(hours=t)).tz_convert(timezone)
         p = price[t]
         charge = opt.charge_w[t]
         discharge = opt.discharge_w[t]
         soc_before = initial_soc_wh if t == 0 else opt.soc_wh[t - 1]
         soc_after = opt.soc_wh[t]
-        soc_before_pct = soc_before / params.capacity_wh * 100
-        soc_after_pct = soc_after / params.capacity_wh * 100
+        soc_before_pct = soc_before * pct_scale
+        soc_after_pct = soc_after * pct_scale
 
         if charge > 10:
             action, power_str = "CHARGE", f"{charge:.0f}W"
@@ -228,7 +384,7 @@ def print_full_schedule(
             action, power_str = "HOLD", "0W"
 
         print(
-            f"  {ts.strftime('%H:%M'):<7} {p:>6.2f} "
+            f"  {hours[t]:<7} {p:>6.2f} "
             f"{action:<11} {power_str:>6} "
             f"{soc_before_pct:>5.0f}% \u2192 {soc_after_pct:.0f}%"
         )
@@ -251,9 +407,12 @@ def _format_action(
     soc_before_pct: float,
     soc_after_pct: float,
     interval_min: int,
+    now_utc: pd.Timestamp | None = None,
 ) -> str:
     """Format a single action line for console output."""
-    ts = pd.Timestamp.now(tz="UTC").strftime("%H:%M:%S")
+    if now_utc is None:
+        now_utc = pd.Timestamp.now(tz="UTC")
+    ts = now_utc.strftime("%H:%M:%S")
     if action == "HOLD":
         return (
             f"{ts} \u2502 HOLD"
@@ -275,14 +434,21 @@ def run_cycle(
     current_soc_wh: float,
     interval_min: int,
     horizon: int,
+    now_utc: pd.Timestamp | None = None,
 ) -> tuple[str, float]:
     """One MPC cycle: get predictions, optimize, extract first action.
 
+    Timezone-aware Timestamp construction isn't free, so the cycle
+    timestamp is computed once here and threaded through.
+
     Returns (formatted_action_string, new_soc_wh).
     """
+    if now_utc is None:
+        now_utc = pd.Timestamp.now(tz="UTC")
     forecasts = cache.get_predictions(config, horizon)
-    now = pd.Timestamp.now(tz="UTC").floor("h")
-    net_load, price = build_optimization_input(forecasts, now, horizon)
+    net_load, price = build_optimization_input(
+        forecasts, now_utc.floor("h"), horizon
+    )
 
     # Optimize from current SoC
     try:
@@ -293,7 +459,7 @@ def run_cycle(
         print(f"  Warning: optimizer failed ({e}), falling back to HOLD")
         soc_pct = current_soc_wh / params.capacity_wh * 100
         return (
-            _format_action("HOLD", 0, 0, soc_pct, soc_pct, interval_min),
+            _format_action("HOLD", 0, 0, soc_pct, soc_pct, interval_min, now_utc),
             current_soc_wh,
         )
 
@@ -316,6 +482,7 @@ def run_cycle(
             soc_before_pct,
             new_soc / params.capacity_wh * 100,
             interval_min,
+            now_utc,
         )
     elif discharge_w > 10:
         energy_wh = min(
@@ -330,11 +497,13 @@ def run_cycle(
             soc_before_pct,
             new_soc / params.capacity_wh * 100,
             interval_min,
+            now_utc,
         )
     else:
         new_soc = current_soc_wh
         action_str = _format_action(
-            "HOLD", 0, 0, soc_before_pct, soc_before_pct, interval_min
+            "HOLD", 0, 0, soc_before_pct, soc_before_pct, interval_min,
+            now_utc,
         )
 
     return action_str, new_soc
@@ -407,10 +576,16 @@ def main():
     total_charged_kwh = 0.0
     total_discharged_kwh = 0.0
 
+    interval_s = args.interval * 60
+    next_tick = time.monotonic() + interval_s
+    prefetch_pool = ThreadPoolExecutor(max_workers=1)
+    prefetch = None
+
     try:
         while True:
             action_str, new_soc = run_cycle(
-                cache, config, params, current_soc_wh, args.interval, args.horizon
+                cache, config, params, current_soc_wh, args.interval, args.horizon,
+                now_utc=pd.Timestamp.now(tz="UTC"),
             )
             print(action_str)
 
@@ -427,9 +602,28 @@ def main():
                 hold_count += 1
 
             current_soc_wh = new_soc
-            time.sleep(args.interval * 60)
+
+            # If the forecast expires during the sleep window, sleep up to
+            # the expiry, kick off the refresh in the background, and let
+            # the rest of the window hide its latency — run_cycle then never
+            # blocks on the weather fetch + model predicts
+            stale_in = cache.seconds_until_stale()
+            if (
+                stale_in < next_tick - time.monotonic()
+                and (prefetch is None or prefetch.done())
+            ):
+                time.sleep(stale_in + 1)
+                prefetch = prefetch_pool.submit(
+                    cache.get_predictions, config, args.horizon
+                )
+
+            # Absolute deadline keeps the cadence drift-free regardless of
+            # how long the cycle itself took
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+            next_tick += interval_s
 
     except KeyboardInterrupt:
+        prefetch_pool.shutdown(wait=False, cancel_futures=True)
         elapsed = time.time() - start_time
         hours = int(elapsed // 3600)
         minutes = int((elapsed % 3600) // 60)
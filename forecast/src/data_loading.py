@@ -1,5 +1,6 @@
 """Load Home Assistant sensor data from the three CSV formats."""
 
+import json
 from pathlib import Path
 from typing import Literal
 
@@ -11,8 +12,18 @@ def load_legacy_csv(path: Path, entity_id: str) -> pd.DataFrame:
 
     Returns DataFrame with columns: timestamp (tz-aware), value (float).
     """
-    df = pd.read_csv(path, dtype={"entity_id": str, "state": str, "last_changed": str})
-    df = df[df["entity_id"] == entity_id].copy()
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv
+
+    # Filter on the Arrow table so rows for other entities are never
+    # materialized as a pandas frame
+    convert = pyarrow.csv.ConvertOptions(
+        column_types={"entity_id": pa.string(), "state": pa.string(), "last_changed": pa.string()},
+        include_columns=["entity_id", "state", "last_changed"],
+    )
+    table = pyarrow.csv.read_csv(path, convert_options=convert)
+    df = table.filter(pc.equal(table["entity_id"], entity_id)).to_pandas()
     df["value"] = pd.to_numeric(df["state"], errors="coerce")
     df = df.dropna(subset=["value"])
     df["timestamp"] = pd.to_datetime(df["last_changed"], utc=True).dt.tz_convert(
@@ -21,28 +32,77 @@ def load_legacy_csv(path: Path, entity_id: str) -> pd.DataFrame:
     return df[["timestamp", "value"]].sort_values("timestamp").reset_index(drop=True)
 
 
+def _ensure_parquet(paths: list[Path]) -> Path:
+    """Mirror the recent CSVs into a sensor_id-partitioned Parquet dataset.
+
+    The weekly CSVs hold every sensor, so a per-sensor load through the
+    raw files parses >95% rows it immediately discards. The dataset lives
+    in `_parquet_v1/` next to the CSVs and is rebuilt whenever the source
+    mtimes change (same manifest scheme as the hourly backtest cache).
+    """
+    import pyarrow as pa
+    import pyarrow.csv
+    import pyarrow.dataset
+
+    cache_dir = paths[0].parent / "_parquet_v1"
+    # Kept outside the dataset dir so pyarrow.dataset doesn't try to read it
+    manifest_path = paths[0].parent / "_parquet_v1.json"
+    sources = {str(p): p.stat().st_mtime_ns for p in paths}
+
+    if manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            manifest = None
+        if manifest == sources:
+            return cache_dir
+
+    convert = pyarrow.csv.ConvertOptions(
+        column_types={"sensor_id": pa.string(), "value": pa.string(), "updated_ts": pa.float64()},
+        include_columns=["sensor_id", "value", "updated_ts"],
+    )
+    table = pa.concat_tables(
+        [pyarrow.csv.read_csv(p, convert_options=convert) for p in paths]
+    )
+    pyarrow.dataset.write_dataset(
+        table,
+        cache_dir,
+        format="parquet",
+        partitioning=["sensor_id"],
+        partitioning_flavor="hive",
+        existing_data_behavior="delete_matching",
+    )
+    with open(manifest_path, "w") as f:
+        json.dump(sources, f)
+    return cache_dir
+
+
 def load_recent_csv(paths: list[Path], sensor_id: str) -> pd.DataFrame:
     """Load recent multi-sensor CSVs (sensor_id,value,updated_ts).
 
     Accepts multiple weekly/daily CSV paths, concatenates and deduplicates.
+    Reads go through a sensor_id-partitioned Parquet mirror so only the
+    requested sensor's row-groups are touched.
     Returns DataFrame with columns: timestamp (tz-aware), value (float).
     """
-    frames = []
-    for p in paths:
-        df = pd.read_csv(p, dtype={"sensor_id": str, "value": str, "updated_ts": float})
-        df = df[df["sensor_id"] == sensor_id].copy()
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
-        df = df.dropna(subset=["value"])
-        df["timestamp"] = pd.to_datetime(df["updated_ts"], unit="s", utc=True).dt.tz_convert(
-            "Europe/Warsaw"
-        )
-        frames.append(df[["timestamp", "value"]])
-
-    if not frames:
+    if not paths:
         return pd.DataFrame(columns=["timestamp", "value"])
 
-    result = pd.concat(frames, ignore_index=True)
-    result = result.drop_duplicates(subset=["timestamp"]).sort_values("timestamp")
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(_ensure_parquet(paths), format="parquet", partitioning="hive")
+    df = dataset.to_table(
+        filter=ds.field("sensor_id") == sensor_id,
+        columns=["value", "updated_ts"],
+    ).to_pandas()
+
+    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    df = df.dropna(subset=["value"])
+    df["timestamp"] = pd.to_datetime(df["updated_ts"], unit="s", utc=True).dt.tz_convert(
+        "Europe/Warsaw"
+    )
+    result = df[["timestamp", "value"]].drop_duplicates(subset=["timestamp"]).sort_values("timestamp")
     return result.reset_index(drop=True)
 
 
@@ -51,7 +111,7 @@ def load_stats_csv(path: Path, sensor_id: str) -> pd.DataFrame:
 
     Returns DataFrame with columns: timestamp (tz-aware), avg, min_val, max_val.
     """
-    df = pd.read_csv(path, dtype={"sensor_id": str})
+    df = pd.read_csv(path, engine="pyarrow", dtype={"sensor_id": str})
     df = df[df["sensor_id"] == sensor_id].copy()
     df["timestamp"] = pd.to_datetime(df["start_time"], unit="s", utc=True).dt.tz_convert(
         "Europe/Warsaw"
@@ -77,13 +137,10 @@ def load_sensor_data(
     Returns DataFrame with columns: timestamp (tz-aware), value (float).
     Prefers: recent > legacy > stats (by resolution).
     """
+    # Frames in priority order, so keep="first" below resolves duplicates
+    # in favor of the higher-resolution source
     frames = []
 
-    if legacy_path and legacy_path.exists():
-        df = load_legacy_csv(legacy_path, sensor_id)
-        if not df.empty:
-            frames.append(df)
-
     if recent_dir and recent_dir.exists():
         csv_files = sorted(recent_dir.glob("*.csv"))
         # Exclude historic_spot_prices.csv — it's a special file
@@ -93,6 +150,11 @@ def load_sensor_data(
             if not df.empty:
                 frames.append(df)
 
+    if legacy_path and legacy_path.exists():
+        df = load_legacy_csv(legacy_path, sensor_id)
+        if not df.empty:
+            frames.append(df)
+
     if stats_path and stats_path.exists():
         df = load_stats_csv(stats_path, sensor_id)
         if not df.empty:
@@ -104,8 +166,10 @@ def load_sensor_data(
         return pd.DataFrame(columns=["timestamp", "value"])
 
     result = pd.concat(frames, ignore_index=True)
-    # Deduplicate: keep first occurrence (recent data tends to be more accurate)
-    result = result.sort_values("timestamp").drop_duplicates(subset=["timestamp"], keep="first")
+    # Dedup first (single pass on the big frame), then sort the smaller
+    # survivor set; mergesort is near-linear since each source is sorted
+    result = result.drop_duplicates(subset=["timestamp"], keep="first")
+    result = result.sort_values("timestamp", kind="mergesort")
     return result.reset_index(drop=True)
 
 
@@ -115,7 +179,12 @@ def load_spot_prices(path: Path) -> pd.DataFrame:
     Returns DataFrame with columns: timestamp (UTC-aware), value (float, PLN/kWh).
     Already hourly data — one row per hour from 2017 onwards.
     """
-    df = pd.read_csv(path, dtype={"sensor_id": str, "value": str, "updated_ts": float})
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        usecols=["value", "updated_ts"],
+        dtype={"value": str, "updated_ts": float},
+    )
     df["value"] = pd.to_numeric(df["value"], errors="coerce")
     df = df.dropna(subset=["value"])
     df["timestamp"] = pd.to_datetime(df["updated_ts"], unit="s", utc=True)
@@ -53,7 +53,9 @@ def evaluate_model(model_name: str, config: dict) -> None:
     # Load model
     model_path = str(model_dir / f"{model_name}_model")
     model = LightGBMModel.load(model_path)
-    print(f"  Loaded: {model_path}.joblib")
+    # load() prefers native .txt, falling back to pre-migration .joblib
+    suffix = ".txt" if (model_dir / f"{model_name}_model.txt").exists() else ".joblib"
+    print(f"  Loaded: {model_path}{suffix}")
 
     # Prepare dataset (same as training)
     prepare_fn = PREPARE_FUNCTIONS[model_name]
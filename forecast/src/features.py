@@ -8,7 +8,7 @@ import pandas as pd
 
 from .config import load_config, project_root
 from .data_loading import load_sensor_data, load_spot_prices
-from .holidays import is_holiday
+from .holidays import is_holiday_array
 from .weather import fetch_historical
 
 
@@ -63,6 +63,30 @@ def _cyclical_encode(series: pd.Series, period: float) -> tuple[pd.Series, pd.Se
     return np.sin(angle), np.cos(angle)
 
 
+def _lagged(x: np.ndarray, n: int) -> np.ndarray:
+    """x shifted by n steps, leading gap backfilled with x[0].
+
+    Equivalent to pd.Series(x).shift(n).bfill() without Series overhead.
+    """
+    if n >= len(x):
+        # Nothing to backfill from; LightGBM treats NaN as missing
+        return np.full(len(x), np.nan)
+    out = np.empty_like(x)
+    out[:n] = x[0]
+    out[n:] = x[:-n]
+    return out
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean with min_periods=1, via cumulative sums."""
+    c = np.cumsum(x)
+    out = np.empty(len(x))
+    head = min(window, len(x))
+    out[:head] = c[:head] / np.arange(1, head + 1)
+    out[window:] = (c[window:] - c[:-window]) / window
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Shared feature helpers
 # ---------------------------------------------------------------------------
@@ -94,8 +118,8 @@ def _add_behavioral_time_features(df: pd.DataFrame, config: dict) -> None:
         pd.Series(local_idx.dayofweek, index=df.index), 7.0
     )
     df["is_weekend"] = pd.Series(local_idx.dayofweek, index=df.index).isin([5, 6]).astype(int)
-    df["is_holiday"] = pd.Series(
-        [is_holiday(d.date()) for d in local_idx], index=df.index
+    df["is_holiday"] = is_holiday_array(
+        local_idx.tz_localize(None).to_numpy()
     ).astype(int)
 
 
@@ -17,12 +17,25 @@ def _make_asymmetric_mse(under_weight: float):
 
     When under_weight > 1, the model prefers to overestimate rather than underestimate.
     LGBMRegressor sklearn API passes (y_true, y_pred) to custom objectives.
+
+    The callback fires once per boosting round, so grad/hess/residual buffers
+    are kept per array size and the arithmetic runs in-place; LightGBM copies
+    the returned arrays before the next round, making reuse safe.
     """
+    buffers: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
     def asymmetric_mse(y_true, y_pred):
-        residual = y_true - y_pred  # positive = underestimation
+        bufs = buffers.get(y_true.size)
+        if bufs is None:
+            bufs = tuple(np.empty(y_true.size) for _ in range(3))
+            buffers[y_true.size] = bufs
+        residual, grad, hess = bufs
+
+        np.subtract(y_true, y_pred, out=residual)  # positive = underestimation
         weight = np.where(residual > 0, under_weight, 1.0)
-        grad = -2.0 * weight * residual  # d(loss)/d(y_pred)
-        hess = 2.0 * weight
+        np.multiply(weight, residual, out=grad)
+        grad *= -2.0  # d(loss)/d(y_pred)
+        np.multiply(weight, 2.0, out=hess)
         return grad, hess
     return asymmetric_mse
 
@@ -31,6 +44,8 @@ class LightGBMModel(BaseModel):
     def __init__(self, params: dict | None = None):
         self.params = params or {}
         self.model: LGBMRegressor | None = None
+        # Native Booster when loaded from a .txt model file (no sklearn wrapper)
+        self._booster = None
         self.feature_names: list[str] = []
         self.train_metrics: dict = {}
 
@@ -76,40 +91,58 @@ class LightGBMModel(BaseModel):
         }
         return self.train_metrics
 
-    def predict(self, X: pd.DataFrame) -> np.ndarray:
-        """Predict using trained model."""
+    @property
+    def booster(self):
+        """Native Booster handle for low-overhead inference (skips sklearn wrapping)."""
+        if self._booster is not None:
+            return self._booster
         if self.model is None:
             raise RuntimeError("Model not trained or loaded")
-        return self.model.predict(X)
+        return self.model.booster_
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        """Predict using trained model.
+
+        Horizon-sized batches (≤64 rows) go through the native booster with
+        num_threads=1: OpenMP thread-pool dispatch costs more than the tree
+        walk itself on inputs that small.
+        """
+        if len(X) <= 64:
+            return self.booster.predict(X, num_threads=1)
+        if self.model is not None:
+            return self.model.predict(X)
+        return self.booster.predict(X)
 
     def save(self, path: str) -> None:
-        """Save model (.joblib) and metadata (.json)."""
-        if self.model is None:
-            raise RuntimeError("No model to save")
+        """Save model (.txt, native Booster format) and metadata (.json).
 
-        # Clear custom objective before pickling (not needed at inference time)
-        obj = self.model.objective
-        if callable(obj):
-            self.model.set_params(objective="regression")
-        joblib.dump(self.model, f"{path}.joblib")
-        if callable(obj):
-            self.model.set_params(objective=obj)
+        save_model writes only the trees — no pickled sklearn wrapper — so
+        the file is smaller, loads faster, and is safe to load untrusted.
+        """
+        booster = self.booster
+        booster.save_model(f"{path}.txt")
 
         meta = {
             "type": "lightgbm",
             "feature_names": self.feature_names,
             "train_metrics": self.train_metrics,
             "params": self.params,
-            "n_estimators_actual": self.model.n_estimators_,
+            "n_estimators_actual": booster.num_trees(),
         }
         with open(f"{path}.json", "w") as f:
             json.dump(meta, f, indent=2)
 
     @classmethod
     def load(cls, path: str) -> "LightGBMModel":
-        """Load model from .joblib + .json files."""
+        """Load model from .txt (native) or .joblib (pre-migration) + .json."""
         model = cls()
-        model.model = joblib.load(f"{path}.joblib")
+        txt_path = Path(f"{path}.txt")
+        if txt_path.exists():
+            import lightgbm as lgb
+
+            model._booster = lgb.Booster(model_file=str(txt_path))
+        else:
+            model.model = joblib.load(f"{path}.joblib")
 
         meta_path = Path(f"{path}.json")
         if meta_path.exists():
@@ -122,11 +155,9 @@ class LightGBMModel(BaseModel):
         return model
 
     def feature_importance(self) -> pd.Series:
-        """Return feature importance (gain-based)."""
-        if self.model is None:
-            raise RuntimeError("Model not trained or loaded")
+        """Return feature importance (split-based)."""
         return pd.Series(
-            self.model.feature_importances_,
+            self.booster.feature_importance(),
             index=self.feature_names,
         ).sort_values(ascending=False)
 
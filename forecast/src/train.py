@@ -136,7 +136,7 @@ def train_model(model_name: str, config: dict) -> None:
     with open(meta_path, "w") as f:
         json.dump(meta, f, indent=2)
 
-    print(f"\n  Model saved: {model_path}.joblib")
+    print(f"\n  Model saved: {model_path}.txt")
 
     # Feature importance plot
     _save_feature_importance(model, plot_dir / f"{model_name}_feature_importance.png")
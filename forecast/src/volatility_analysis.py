@@ -16,6 +16,9 @@ Usage:
 """
 
 import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -28,8 +31,9 @@ from .battery_hw_roi import (
     generate_pylontech_configs,
     run_config,
 )
-from .config import load_config, project_root
+from .config import load_config, project_root, python_root
 from .data_loading import load_spot_prices
+from .optimize import precompute_days
 
 # ── Academic references ─────────────────────────────────────────────────────
 
@@ -145,44 +149,75 @@ RES_TRAJECTORY = {
 # Spread multiplier scenarios relative to 2024-2025 baseline (1.0x)
 # Based on literature: each 10pp RES increase → ~30-60% spread increase,
 # but partially offset by storage deployment and market coupling.
+# k is the spread growth per pp of RES share above the 28% baseline.
 SCENARIOS = {
     "conservative": {
         "label": "Conservative (storage dampens volatility)",
         "color": "#5bb88a",
         # Storage + interconnectors limit spread growth
-        "spread_factor": lambda res: 1.0 + 0.012 * max(0, res - 28),
+        "k": 0.012,
     },
     "moderate": {
         "label": "Moderate (literature consensus)",
         "color": "#e8b830",
         # Follows observed RES-volatility relationship
-        "spread_factor": lambda res: 1.0 + 0.020 * max(0, res - 28),
+        "k": 0.020,
     },
     "aggressive": {
         "label": "Aggressive (fast RES, slow storage)",
         "color": "#e87c6c",
         # Limited storage buildout, more extreme weather events
-        "spread_factor": lambda res: 1.0 + 0.030 * max(0, res - 28),
+        "k": 0.030,
     },
 }
 
 
+def _spread_factor(k: float, res_share):
+    """Spread multiplier for a RES share (scalar or array) under slope k."""
+    return 1.0 + k * np.maximum(0.0, np.asarray(res_share, dtype=float) - 28.0)
+
+
 def compute_historical_spreads(prices_path) -> pd.DataFrame:
-    """Load spot prices and compute yearly average daily spread."""
+    """Load spot prices and compute yearly average daily spread.
+
+    Cached to Parquet keyed by the price CSV's mtime (same scheme as the
+    hourly backtest cache), so warm runs skip the CSV parse entirely.
+    """
+    cache_dir = python_root() / "cache"
+    cache_path = cache_dir / "historical_spreads.parquet"
+    manifest_path = cache_dir / "historical_spreads.json"
+    sources = {str(prices_path): prices_path.stat().st_mtime_ns}
+
+    if cache_path.exists() and manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            manifest = None
+        if manifest == sources:
+            return pd.read_parquet(cache_path)
+
     price_df = load_spot_prices(prices_path)
     df = price_df.set_index("timestamp").sort_index()
     df.index = df.index.tz_convert("UTC")
     hourly = df["value"].resample("h").mean().dropna()
 
-    daily = hourly.resample("D").agg(["mean", "std", "min", "max"])
+    # Groupbys instead of chained D/YE resamples: empty days only produce
+    # all-NaN rows the yearly means skip anyway, and one grouping pass per
+    # level avoids the calendar bin construction over multi-year spans
+    daily = hourly.groupby(hourly.index.floor("D")).agg(["mean", "std", "min", "max"])
     daily["spread"] = daily["max"] - daily["min"]
 
-    yearly = daily.resample("YE").agg(
+    yearly = daily.groupby(daily.index.year).agg(
         mean_spread=("spread", "mean"),
         mean_price=("mean", "mean"),
         mean_std=("std", "mean"),
     )
-    yearly.index = yearly.index.year
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    yearly.to_parquet(cache_path)
+    with open(manifest_path, "w") as f:
+        json.dump(sources, f)
     return yearly
 
 
@@ -197,21 +232,19 @@ def project_spreads(historical: pd.DataFrame) -> pd.DataFrame:
         recent = historical.tail(2)
     baseline_spread = recent["mean_spread"].mean()
 
-    rows = []
-    for year in range(2018, 2041):
-        res = RES_TRAJECTORY.get(year, 70)
-        row = {"year": year, "res_share": res}
-
-        if year in historical.index:
-            row["historical"] = historical.loc[year, "mean_spread"]
-
-        for name, scenario in SCENARIOS.items():
-            factor = scenario["spread_factor"](res)
-            row[name] = baseline_spread * factor
+    # Whole-trajectory arrays instead of a per-year dict loop: each
+    # scenario column is one fused numpy expression
+    years = np.arange(2018, 2041)
+    res_share = np.array([RES_TRAJECTORY.get(y, 70) for y in years], dtype=float)
 
-        rows.append(row)
+    data = {
+        "res_share": res_share,
+        "historical": historical["mean_spread"].reindex(years).to_numpy(),
+    }
+    for name, scenario in SCENARIOS.items():
+        data[name] = baseline_spread * _spread_factor(scenario["k"], res_share)
 
-    return pd.DataFrame(rows).set_index("year")
+    return pd.DataFrame(data, index=pd.Index(years, name="year"))
 
 
 def scale_prices(hourly: pd.DataFrame, spread_factor: float) -> pd.DataFrame:
@@ -220,12 +253,36 @@ def scale_prices(hourly: pd.DataFrame, spread_factor: float) -> pd.DataFrame:
     Preserves daily mean prices but amplifies/dampens the spread.
     """
     result = hourly.copy()
-    daily_mean = result["price_pln_kwh"].resample("D").transform("mean")
-    deviation = result["price_pln_kwh"] - daily_mean
-    result["price_pln_kwh"] = daily_mean + deviation * spread_factor
+    price = result["price_pln_kwh"]
+    daily_mean = price.groupby(result.index.floor("D")).transform("mean")
+    result["price_pln_kwh"] = daily_mean + (price - daily_mean) * spread_factor
     return result
 
 
+# Configs whose payback misses this bound even at the widest spread are
+# skipped for the narrower factors; matches the payback clip in the plot
+_PRUNE_PAYBACK_YEARS = 30.0
+
+# Day slices per spread factor, shared with worker processes via the pool
+# initializer so each task ships only its (config, factor) key
+_sens_days: dict | None = None
+
+
+def _init_sensitivity_worker(days_by_factor: dict) -> None:
+    global _sens_days
+    _sens_days = days_by_factor
+
+
+def _run_sensitivity_task(task: tuple) -> dict:
+    hw, sf, soc_min_pct, soc_max_pct, export_coeff = task
+    return run_config(
+        _sens_days[sf], hw,
+        soc_min_pct=soc_min_pct,
+        soc_max_pct=soc_max_pct,
+        export_coeff=export_coeff,
+    )
+
+
 def run_sensitivity(
     hourly: pd.DataFrame,
     configs: list[HardwareConfig],
@@ -236,26 +293,84 @@ def run_sensitivity(
     soc_max_pct: float,
     export_coeff: float,
 ) -> pd.DataFrame:
-    """Run LP optimization for each config x spread_factor combination."""
-    rows = []
-    total = len(configs) * len(spread_factors)
-    done = 0
+    """Run LP optimization for each config x spread_factor combination.
 
-    for hw in configs:
-        for sf in spread_factors:
-            done += 1
-            print(
-                f"  [{done}/{total}] {hw.short_label} @ {sf:.1f}x spread...",
-                end="",
-                flush=True,
-            )
-            scaled = scale_prices(hourly, sf)
-            r = run_config(
-                scaled, hw, start, end,
-                soc_min_pct=soc_min_pct,
-                soc_max_pct=soc_max_pct,
-                export_coeff=export_coeff,
-            )
+    The (config, factor) solves are independent, so they fan out across a
+    process pool; prices are scaled and sliced once per factor and shared.
+    """
+    # Decompose prices into daily mean + deviation once; each factor is
+    # then a single fused multiply-add instead of a fresh groupby
+    price = hourly["price_pln_kwh"].to_numpy()
+    daily_mean = (
+        hourly["price_pln_kwh"]
+        .groupby(hourly.index.floor("D"))
+        .transform("mean")
+        .to_numpy()
+    )
+    deviation = price - daily_mean
+    days_by_factor = {
+        sf: precompute_days(
+            pd.DataFrame(
+                {
+                    "net_load_w": hourly["net_load_w"],
+                    "price_pln_kwh": daily_mean + deviation * sf,
+                },
+                index=hourly.index,
+            ),
+            start,
+            end,
+        )
+        for sf in spread_factors
+    }
+    # Payback falls monotonically as the spread widens, so a config that
+    # still misses the plot's 30-year clip at the widest spread cannot
+    # reach it at any narrower one. Probe each config at max spread first
+    # and skip the remaining factors for the hopeless ones.
+    max_sf = max(spread_factors)
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_sensitivity_worker,
+        initargs=(days_by_factor,),
+    ) as pool:
+        probes = list(pool.map(
+            _run_sensitivity_task,
+            [(hw, max_sf, soc_min_pct, soc_max_pct, export_coeff) for hw in configs],
+        ))
+        viable = {
+            hw.label for hw, r in zip(configs, probes)
+            if r["payback_years"] <= _PRUNE_PAYBACK_YEARS
+        }
+        rest = [
+            (hw, sf, soc_min_pct, soc_max_pct, export_coeff)
+            for sf in spread_factors
+            for hw in configs
+            if sf != max_sf and hw.label in viable
+        ]
+        rest_results = list(pool.map(_run_sensitivity_task, rest))
+
+    results = {(t[0].label, t[1]): r for t, r in zip(rest, rest_results)}
+    for hw, r in zip(configs, probes):
+        results[(hw.label, max_sf)] = r
+
+    rows = []
+    for sf in spread_factors:
+        for hw in configs:
+            r = results.get((hw.label, sf))
+            if r is None:
+                print(
+                    f"  {hw.short_label} @ {sf:.1f}x spread: pruned"
+                    f" (payback > {_PRUNE_PAYBACK_YEARS:.0f}y at {max_sf:.1f}x)"
+                )
+                r = {
+                    "annual_savings": float("nan"),
+                    "payback_years": float("inf"),
+                    "roi_pct": float("nan"),
+                }
+            else:
+                print(
+                    f"  {hw.short_label} @ {sf:.1f}x spread:"
+                    f" payback {r['payback_years']:.1f}y"
+                )
             rows.append({
                 "config": hw,
                 "label": hw.label,
@@ -267,7 +382,6 @@ def run_sensitivity(
                 "payback_years": r["payback_years"],
                 "roi_pct": r["roi_pct"],
             })
-            print(f" payback {r['payback_years']:.1f}y")
 
     return pd.DataFrame(rows)
 
@@ -343,11 +457,11 @@ def plot_results(
 
     # ── Graph 2: Payback sensitivity ────────────────────────────────────
     # Map spread factors to approximate future years using moderate scenario
-    mod_func = SCENARIOS["moderate"]["spread_factor"]
+    mod_k = SCENARIOS["moderate"]["k"]
     factor_to_year = {}
     for year, res in RES_TRAJECTORY.items():
         if year >= 2025:
-            f = round(mod_func(res), 1)
+            f = round(float(_spread_factor(mod_k, res)), 1)
             if f not in factor_to_year:
                 factor_to_year[f] = year
 
@@ -374,9 +488,10 @@ def plot_results(
 
     # Add secondary x-axis labels with approximate years
     ax2_year = ax2.twiny()
-    year_labels = {2025: 1.0, 2030: mod_func(RES_TRAJECTORY[2030]),
-                   2035: mod_func(RES_TRAJECTORY[2035]),
-                   2040: mod_func(RES_TRAJECTORY[2040])}
+    year_labels = {2025: 1.0,
+                   2030: float(_spread_factor(mod_k, RES_TRAJECTORY[2030])),
+                   2035: float(_spread_factor(mod_k, RES_TRAJECTORY[2035])),
+                   2040: float(_spread_factor(mod_k, RES_TRAJECTORY[2040]))}
     ax2_year.set_xlim(ax2.get_xlim())
     ax2_year.set_xticks(list(year_labels.values()))
     ax2_year.set_xticklabels(
@@ -566,8 +681,9 @@ def main():
         print()
 
     # Current vs moderate 2030/2035 comparison
-    mod_2030 = SCENARIOS["moderate"]["spread_factor"](RES_TRAJECTORY[2030])
-    mod_2035 = SCENARIOS["moderate"]["spread_factor"](RES_TRAJECTORY[2035])
+    mod_k = SCENARIOS["moderate"]["k"]
+    mod_2030 = float(_spread_factor(mod_k, RES_TRAJECTORY[2030]))
+    mod_2035 = float(_spread_factor(mod_k, RES_TRAJECTORY[2035]))
     print(f"\nModerate scenario: 2030 ≈ {mod_2030:.1f}x spread, 2035 ≈ {mod_2035:.1f}x spread")
 
     for hw in selected:
@@ -11,6 +11,10 @@ HOURLY_PARAMS = (
     "sunshine_duration,wind_speed_10m,precipitation,relative_humidity_2m"
 )
 
+# One session for all Open-Meteo calls: keeps the TCP/TLS connection
+# alive across the per-month fetch loop instead of handshaking per GET
+_session = requests.Session()
+
 
 def fetch_historical(
     lat: float,
@@ -122,7 +126,7 @@ def fetch_forecast(lat: float, lon: float, hours: int = 48) -> pd.DataFrame:
         "forecast_hours": hours,
         "timezone": "UTC",
     }
-    resp = requests.get(url, params=params, timeout=30)
+    resp = _session.get(url, params=params, timeout=30)
     resp.raise_for_status()
     data = resp.json()
     return _parse_hourly_response(data)
@@ -141,7 +145,7 @@ def _fetch_open_meteo_historical(
         "hourly": HOURLY_PARAMS,
         "timezone": "UTC",
     }
-    resp = requests.get(url, params=params, timeout=60)
+    resp = _session.get(url, params=params, timeout=60)
     resp.raise_for_status()
     data = resp.json()
     return _parse_hourly_response(data)
@@ -152,7 +156,11 @@ def _parse_hourly_response(data: dict) -> pd.DataFrame:
     hourly = data["hourly"]
     df = pd.DataFrame(
         {
-            "timestamp": pd.to_datetime(hourly["time"], utc=True),
+            # Explicit format skips per-string dateutil autodetection;
+            # Open-Meteo always emits minute-resolution ISO times
+            "timestamp": pd.to_datetime(
+                hourly["time"], format="%Y-%m-%dT%H:%M", utc=True
+            ),
             "temperature_2m": hourly.get("temperature_2m"),
             "cloud_cover": hourly.get("cloud_cover"),
             "direct_radiation": hourly.get("direct_radiation"),
@@ -1,11 +1,14 @@
 """Tests for battery schedule optimization."""
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from forecast.src.optimize import (
     BatteryParams,
+    no_battery_daily_costs,
     optimize_battery,
+    precompute_days,
     simulate_heuristic,
     simulate_no_battery,
 )
@@ -28,120 +31,125 @@ def make_price_spread():
     return price
 
 
+# Shared inputs built once per module; read-only so a test (or the code
+# under test) mutating them fails loudly instead of leaking state.
+
+@pytest.fixture(scope="module")
+def flat_net_load():
+    """Constant 1 kW import for 24h."""
+    arr = np.full(24, 1000.0)
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.fixture(scope="module")
+def flat_price():
+    """Constant 0.30 PLN/kWh for 24h."""
+    arr = np.full(24, 0.30)
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.fixture(scope="module")
+def spread_price():
+    """Cheap-night/expensive-evening price profile."""
+    arr = make_price_spread()
+    arr.setflags(write=False)
+    return arr
+
+
 class TestLPOptimal:
-    def test_flat_price_no_benefit(self):
+    def test_flat_price_no_benefit(self, flat_net_load, flat_price):
         """With flat prices, battery can't arbitrage -- cost should equal no-battery."""
-        net_load = np.full(24, 1000.0)  # constant 1kW import
-        price = np.full(24, 0.30)
-
-        no_batt = simulate_no_battery(net_load, price, PARAMS.export_coeff)
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        no_batt = simulate_no_battery(flat_net_load, flat_price, PARAMS.export_coeff)
+        opt = optimize_battery(flat_net_load, flat_price, PARAMS, PARAMS.soc_min_wh)
 
         assert opt.status == "optimal"
         assert opt.total_cost_pln == pytest.approx(no_batt.total_cost_pln, abs=0.01)
 
-    def test_price_spread_arbitrage(self):
+    def test_price_spread_arbitrage(self, flat_net_load, spread_price):
         """With price spread, optimal should be cheaper than no-battery."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
-        no_batt = simulate_no_battery(net_load, price, PARAMS.export_coeff)
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        no_batt = simulate_no_battery(flat_net_load, spread_price, PARAMS.export_coeff)
+        opt = optimize_battery(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         assert opt.status == "optimal"
         assert opt.total_cost_pln < no_batt.total_cost_pln
 
-    def test_soc_bounds(self):
+    def test_soc_bounds(self, flat_net_load, spread_price):
         """SoC should never go below min or above max."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        opt = optimize_battery(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         assert opt.soc_wh.min() >= PARAMS.soc_min_wh - 1e-6
         assert opt.soc_wh.max() <= PARAMS.soc_max_wh + 1e-6
 
-    def test_power_bounds(self):
+    def test_power_bounds(self, flat_net_load, spread_price):
         """Charge/discharge should not exceed max power."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        opt = optimize_battery(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         assert opt.charge_w.max() <= PARAMS.max_power_w + 1e-6
         assert opt.discharge_w.max() <= PARAMS.max_power_w + 1e-6
 
-    def test_energy_balance(self):
+    def test_energy_balance(self, flat_net_load, spread_price):
         """Energy balance: import - export = net_load + charge - discharge."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        opt = optimize_battery(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
-        balance = opt.import_w - opt.export_w - net_load - opt.charge_w + opt.discharge_w
+        balance = (
+            opt.import_w - opt.export_w - flat_net_load - opt.charge_w + opt.discharge_w
+        )
         np.testing.assert_allclose(balance, 0, atol=1e-6)
 
-    def test_soc_evolution(self):
-        """SoC[t] = SoC[t-1] + charge[t] - discharge[t]."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
+    def test_soc_evolution(self, flat_net_load, spread_price):
+        """SoC[t] = SoC[t-1] + charge[t]·η - discharge[t]/η (η = √RTE)."""
         initial_soc = PARAMS.soc_min_wh
 
-        opt = optimize_battery(net_load, price, PARAMS, initial_soc)
+        opt = optimize_battery(flat_net_load, spread_price, PARAMS, initial_soc)
 
-        # Check first timestep
-        expected_soc0 = initial_soc + opt.charge_w[0] - opt.discharge_w[0]
-        assert opt.soc_wh[0] == pytest.approx(expected_soc0, abs=1e-6)
+        # One vectorized check over the whole horizon instead of 24
+        # scalar approx comparisons
+        eta = np.sqrt(PARAMS.round_trip_efficiency)
+        prev = np.concatenate(([initial_soc], opt.soc_wh[:-1]))
+        expected = prev + opt.charge_w * eta - opt.discharge_w / eta
+        np.testing.assert_allclose(opt.soc_wh, expected, atol=1e-6)
 
-        # Check all subsequent timesteps
-        for t in range(1, 24):
-            expected = opt.soc_wh[t - 1] + opt.charge_w[t] - opt.discharge_w[t]
-            assert opt.soc_wh[t] == pytest.approx(expected, abs=1e-6)
-
-    def test_optimal_leq_heuristic(self):
+    def test_optimal_leq_heuristic(self, flat_net_load, spread_price):
         """LP optimal should never be more expensive than heuristic."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
         initial_soc = PARAMS.soc_min_wh
 
-        heur = simulate_heuristic(net_load, price, PARAMS, initial_soc)
-        opt = optimize_battery(net_load, price, PARAMS, initial_soc)
+        heur = simulate_heuristic(flat_net_load, spread_price, PARAMS, initial_soc)
+        opt = optimize_battery(flat_net_load, spread_price, PARAMS, initial_soc)
 
         assert opt.total_cost_pln <= heur.total_cost_pln + 1e-6
 
-    def test_charges_during_cheap_hours(self):
+    def test_charges_during_cheap_hours(self, spread_price):
         """With price spread, LP should charge during cheap hours."""
         net_load = np.full(24, 500.0)
-        price = make_price_spread()
 
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        opt = optimize_battery(net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         # Should charge more during cheap hours (0-5) than expensive hours (17-20)
         cheap_charge = opt.charge_w[:6].sum()
         expensive_charge = opt.charge_w[17:21].sum()
         assert cheap_charge > expensive_charge
 
-    def test_export_only_loads(self):
+    def test_export_only_loads(self, spread_price):
         """With negative net load (PV surplus), battery should still work."""
         net_load = np.full(24, -2000.0)  # constant 2kW export
-        price = make_price_spread()
 
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        opt = optimize_battery(net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         assert opt.status == "optimal"
         # Energy balance still holds
         balance = opt.import_w - opt.export_w - net_load - opt.charge_w + opt.discharge_w
         np.testing.assert_allclose(balance, 0, atol=1e-6)
 
-    def test_mixed_net_load(self):
+    def test_mixed_net_load(self, spread_price):
         """Mix of import and export hours."""
         net_load = np.zeros(24)
         net_load[:12] = -3000  # morning: PV surplus
         net_load[12:] = 2000   # evening: consumption
-        price = make_price_spread()
 
-        opt = optimize_battery(net_load, price, PARAMS, PARAMS.soc_min_wh)
-        no_batt = simulate_no_battery(net_load, price, PARAMS.export_coeff)
+        opt = optimize_battery(net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
+        no_batt = simulate_no_battery(net_load, spread_price, PARAMS.export_coeff)
 
         assert opt.status == "optimal"
         assert opt.total_cost_pln <= no_batt.total_cost_pln + 1e-6
@@ -161,66 +169,79 @@ class TestHeuristic:
         assert p33 == pytest.approx(0.08)
         assert p67 == pytest.approx(0.16)
 
-    def test_charges_when_cheap(self):
+    def test_charges_when_cheap(self, flat_net_load, spread_price):
         """Heuristic should charge when price <= P33."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
-        heur = simulate_heuristic(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        heur = simulate_heuristic(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         # Cheap hours (0-5, price=0.10) should have charging
         assert heur.charge_w[:6].sum() > 0
 
-    def test_discharges_when_expensive(self):
+    def test_discharges_when_expensive(self, flat_net_load, spread_price):
         """Heuristic should discharge when price >= P67."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
         # Need some SoC to discharge -- start at max
-        heur = simulate_heuristic(net_load, price, PARAMS, PARAMS.soc_max_wh)
+        heur = simulate_heuristic(flat_net_load, spread_price, PARAMS, PARAMS.soc_max_wh)
 
         # Expensive hours (17-20, price=0.50) should have discharging
         assert heur.discharge_w[17:21].sum() > 0
 
-    def test_soc_bounds_respected(self):
+    def test_soc_bounds_respected(self, flat_net_load, spread_price):
         """Heuristic should respect SoC bounds."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
-
-        heur = simulate_heuristic(net_load, price, PARAMS, PARAMS.soc_min_wh)
+        heur = simulate_heuristic(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
         assert heur.soc_wh.min() >= PARAMS.soc_min_wh - 1e-6
         assert heur.soc_wh.max() <= PARAMS.soc_max_wh + 1e-6
 
-    def test_energy_balance(self):
+    def test_energy_balance(self, flat_net_load, spread_price):
         """Heuristic energy balance: import - export = net_load + charge - discharge."""
-        net_load = np.full(24, 1000.0)
-        price = make_price_spread()
+        heur = simulate_heuristic(flat_net_load, spread_price, PARAMS, PARAMS.soc_min_wh)
 
-        heur = simulate_heuristic(net_load, price, PARAMS, PARAMS.soc_min_wh)
-
-        balance = heur.import_w - heur.export_w - net_load - heur.charge_w + heur.discharge_w
+        balance = (
+            heur.import_w - heur.export_w - flat_net_load - heur.charge_w
+            + heur.discharge_w
+        )
         np.testing.assert_allclose(balance, 0, atol=1e-6)
 
 
+class TestPrecomputeDays:
+    def test_float32_totals_match_float64(self):
+        """float32 day slices must not move daily totals beyond display precision."""
+        rng = np.random.default_rng(42)
+        idx = pd.date_range("2024-01-01", periods=72, freq="h", tz="UTC")
+        net_load = rng.normal(200, 900, 72)
+        price = rng.uniform(0.1, 1.2, 72)
+        hourly = pd.DataFrame(
+            {"net_load_w": net_load, "price_pln_kwh": price}, index=idx
+        )
+
+        days = precompute_days(hourly, idx[0], idx[-1] + pd.Timedelta(hours=1))
+
+        assert len(days) == 3
+        assert all(d[1].dtype == np.float32 for d in days)
+
+        f32_costs = no_battery_daily_costs(days, 0.8)
+        f64_costs = [
+            simulate_no_battery(
+                net_load[i * 24 : (i + 1) * 24], price[i * 24 : (i + 1) * 24], 0.8
+            ).total_cost_pln
+            for i in range(3)
+        ]
+        np.testing.assert_allclose(f32_costs, f64_costs, rtol=1e-4)
+
+
 class TestNoBattery:
-    def test_import_only(self):
+    def test_import_only(self, flat_net_load, flat_price):
         """Positive net load = all import."""
-        net_load = np.full(24, 1000.0)
-        price = np.full(24, 0.30)
-
-        result = simulate_no_battery(net_load, price, 0.8)
+        result = simulate_no_battery(flat_net_load, flat_price, 0.8)
 
         np.testing.assert_allclose(result.import_w, 1000.0)
         np.testing.assert_allclose(result.export_w, 0.0)
         assert result.total_cost_pln == pytest.approx(24 * 1000 * 0.30 / 1000)
 
-    def test_export_only(self):
+    def test_export_only(self, flat_price):
         """Negative net load = all export."""
         net_load = np.full(24, -1000.0)
-        price = np.full(24, 0.30)
 
-        result = simulate_no_battery(net_load, price, 0.8)
+        result = simulate_no_battery(net_load, flat_price, 0.8)
 
         np.testing.assert_allclose(result.import_w, 0.0)
         np.testing.assert_allclose(result.export_w, 1000.0)